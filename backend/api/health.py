@@ -0,0 +1,65 @@
+import time
+
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from core.config import get_settings
+from core.health import ProbeResult, check_database, liveness_probe, measure_loop_lag, pool_stats, readiness_probe
+from core.load_shedding import load_shedder
+from core.startup import startup_state
+from db.session import get_engine
+
+router = APIRouter(
+    tags=['Health']
+)
+
+
+def _probe_response(result : ProbeResult) -> JSONResponse:
+    body = {'status': 'ok' if result.ok else 'unavailable', **result.checks}
+    code = status.HTTP_200_OK if result.ok else status.HTTP_503_SERVICE_UNAVAILABLE
+    return JSONResponse(body, status_code=code, headers={'Cache-Control': 'no-store'})
+
+
+@router.get(
+    path='/healthz',
+)
+async def healthz():
+    settings = get_settings()
+
+    async def probe() -> ProbeResult:
+        lag = await measure_loop_lag()
+        return ProbeResult(
+            ok=lag * 1000 < settings.HEALTH_MAX_LOOP_LAG_MS,
+            checks={'loop_lag_ms': round(lag * 1000, 2)},
+            checked_at=time.monotonic(),
+        )
+
+    liveness_probe.ttl = settings.HEALTH_CACHE_SECONDS
+    return _probe_response(await liveness_probe.get(probe))
+
+
+@router.get(
+    path='/readyz',
+)
+async def readyz(engine : AsyncEngine = Depends(get_engine)):
+    settings = get_settings()
+
+    async def probe() -> ProbeResult:
+        lag = await measure_loop_lag()
+        database = await check_database(engine, timeout=settings.HEALTH_DB_TIMEOUT_SECONDS)
+        return ProbeResult(
+            ok=startup_state.ready and database['ok'],
+            checks={
+                'ready': startup_state.ready,
+                'startup_ms': startup_state.timings_ms,
+                'loop_lag_ms': round(lag * 1000, 2),
+                'database': database,
+                'pool': pool_stats(engine),
+                'load': load_shedder.stats(),
+            },
+            checked_at=time.monotonic(),
+        )
+
+    readiness_probe.ttl = settings.HEALTH_CACHE_SECONDS
+    return _probe_response(await readiness_probe.get(probe))
@@ -2,6 +2,7 @@ from fastapi import APIRouter
 
 from api.v1.feedback import router as feedback_router
 from api.v1.auth import router as auth_router
+from api.v1.audit import router as audit_router
 
 router = APIRouter(
     prefix='/api/v1'
@@ -9,3 +10,4 @@ router = APIRouter(
 
 router.include_router(feedback_router)
 router.include_router(auth_router)
+router.include_router(audit_router)
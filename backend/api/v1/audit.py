@@ -0,0 +1,35 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from crud.audit import list_audit_entries
+from schemas.audit import AuditPage
+from db.session import get_db
+from core.deps import get_current_user
+
+router = APIRouter(
+    prefix='/admin',
+    tags=['/Admin']
+)
+
+
+@router.get(
+    path='/audit',
+    response_model=AuditPage,
+)
+async def list_audit_log(
+    limit : int = Query(default=50, ge=1, le=200),
+    before_id : int | None = Query(default=None, ge=1),
+    action : str | None = Query(default=None, max_length=50),
+    actor_id : int | None = Query(default=None),
+    db : AsyncSession = Depends(get_db),
+    _user=Depends(get_current_user),
+):
+    # Newest first. Events reach the table in batches, so the last few seconds may not be visible yet.
+    items, next_before_id = await list_audit_entries(
+        db,
+        limit=limit,
+        before_id=before_id,
+        action=action,
+        actor_id=actor_id,
+    )
+    return AuditPage(items=items, next_before_id=next_before_id)
@@ -4,12 +4,20 @@ from typing import Annotated
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
-from schemas.auth import Token, BootstrapAdmin
+from schemas.auth import Token, BootstrapAdmin, RefreshRequest
 from schemas.user import UserCreate, UserOut
 from db.session import get_db
 from crud.admin import create_user, get_user_by_email, get_user_by_id, delete_user
+from crud.refresh_token import (
+    get_refresh_token,
+    is_expired,
+    issue_refresh_token,
+    revoke_refresh_token,
+    revoke_token_family,
+)
 from core.security import verify_password, create_access
 from core.deps import get_current_user
+from core.audit import audit_trail
 from fastapi import status
 from core.config import get_settings
 from models.user import User
@@ -30,7 +38,39 @@ async def login(form_data : Annotated[OAuth2PasswordRequestForm, Depends()], db
         raise HTTPException(status_code=401)
     
     access_token = create_access(subject=str(user.id))
-    return Token(access_token=access_token, token_type='bearer')
+    refresh_token = await issue_refresh_token(user_id=user.id, db=db)
+    return Token(access_token=access_token, token_type='bearer', refresh_token=refresh_token)
+
+
+@router.post(
+    path='/refresh',
+    response_model=Token
+)
+async def refresh(payload : RefreshRequest, db : AsyncSession = Depends(get_db)):
+    token = await get_refresh_token(payload.refresh_token, db=db)
+    if token is None or is_expired(token):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='Invalid refresh token')
+
+    if token.revoked_at is not None or not await revoke_refresh_token(token, db=db):
+        # A rotated token came back: it was leaked or replayed, so end the whole session.
+        await revoke_token_family(token.family_id, db=db)
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='Invalid refresh token')
+
+    refresh_token = await issue_refresh_token(user_id=token.user_id, db=db, family_id=token.family_id)
+    access_token = create_access(subject=str(token.user_id))
+    return Token(access_token=access_token, token_type='bearer', refresh_token=refresh_token)
+
+
+@router.post(
+    path='/logout',
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_model=None,
+)
+async def logout(payload : RefreshRequest, db : AsyncSession = Depends(get_db)) -> None:
+    token = await get_refresh_token(payload.refresh_token, db=db)
+    if token is not None:
+        await revoke_token_family(token.family_id, db=db)
+    return None
 
 
 @router.post(
@@ -66,12 +106,14 @@ async def bootstrap_admin(
 async def create_admin(
     payload : UserCreate,
     db : AsyncSession = Depends(get_db),
-    _user=Depends(get_current_user),
+    user=Depends(get_current_user),
 ):
     existing = await get_user_by_email(payload.email, db=db)
     if existing:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail='User already exists')
-    return await create_user(email=payload.email, password=payload.password, db=db)
+    created = await create_user(email=payload.email, password=payload.password, db=db)
+    audit_trail.record('admin.create', actor=user, target_type='user', target_id=created.id, email=created.email)
+    return created
 
 
 @router.delete(
@@ -82,11 +124,13 @@ async def create_admin(
 async def delete_admin(
     user_id : int,
     db : AsyncSession = Depends(get_db),
-    _user=Depends(get_current_user),
+    current_user=Depends(get_current_user),
 ) -> None:
     user = await get_user_by_id(user_id=user_id, db=db)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='User not found')
+    email = user.email
     await delete_user(user=user, db=db)
+    audit_trail.record('admin.delete', actor=current_user, target_type='user', target_id=user_id, email=email)
     return None
     
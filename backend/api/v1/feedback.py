@@ -1,4 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import io
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from crud.feedback import (
@@ -8,11 +11,17 @@ from crud.feedback import (
     get_feedback_list,
     set_feedback_approved,
 )
+from crud.feedback_import import ImportFormat, detect_format, import_feedback
 from crud.moderation import get_or_create_moderation_settings, update_moderation_settings
-from schemas.feedback import FeedbackCreate, FeedbackOut
+from crud.trends import get_trend_report
+from schemas.feedback import FeedbackCreate, FeedbackImportReport, FeedbackOut
 from schemas.moderation import ModerationSettingsOut, ModerationSettingsUpdate
+from schemas.trends import TrendReport
 from db.session import get_db
+from core.audit import audit_trail
 from core.deps import get_current_user
+from core.public_feed import public_feed
+from core.trends import trend_counter
 
 router = APIRouter(
     prefix='/feedback',
@@ -25,14 +34,25 @@ router = APIRouter(
     status_code=status.HTTP_201_CREATED,
 )
 async def create_feedback(payload : FeedbackCreate, db : AsyncSession = Depends(get_db)):
-    return await create_feedback_crud(db=db, payload=payload)
+    feedback = await create_feedback_crud(db=db, payload=payload)
+    trend_counter.add(feedback.text, feedback.created_at)
+    if feedback.is_approved:
+        public_feed.invalidate()
+    return feedback
 
 @router.get(
     path='/',
     response_model=list[FeedbackOut],
 )
-async def list_feedback(db: AsyncSession = Depends(get_db)):
-    return await get_feedback_list(db=db)
+async def list_feedback(request: Request, db: AsyncSession = Depends(get_db)):
+    snapshot = await public_feed.get(db)
+    headers = {'ETag': snapshot.etag, 'Vary': 'Accept-Encoding'}
+    if request.headers.get('if-none-match') == snapshot.etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if 'gzip' in request.headers.get('accept-encoding', ''):
+        headers['Content-Encoding'] = 'gzip'
+        return Response(content=snapshot.gzip_body, media_type='application/json', headers=headers)
+    return Response(content=snapshot.body, media_type='application/json', headers=headers)
 
 @router.delete(
     path='/delete/{f_id}', 
@@ -42,12 +62,16 @@ async def list_feedback(db: AsyncSession = Depends(get_db)):
 async def delete_feedback(
     f_id: int,
     db: AsyncSession = Depends(get_db),
-    _user=Depends(get_current_user),
+    user=Depends(get_current_user),
 ) -> None:
     feedback = await get_feedback_by_id(f_id=f_id, db=db)
     if not feedback:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Feedback not found')
+    was_approved = feedback.is_approved
     await delete_feedback_crud(feedback=feedback, db=db)
+    audit_trail.record('feedback.delete', actor=user, target_type='feedback', target_id=f_id, was_approved=was_approved)
+    if was_approved:
+        public_feed.invalidate()
     return None
 
 @router.get(
@@ -67,12 +91,15 @@ async def list_feedback_admin(
 async def approve_feedback(
     f_id: int,
     db: AsyncSession = Depends(get_db),
-    _user=Depends(get_current_user),
+    user=Depends(get_current_user),
 ):
     feedback = await get_feedback_by_id(f_id=f_id, db=db)
     if not feedback:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Feedback not found')
-    return await set_feedback_approved(feedback=feedback, is_approved=True, db=db)
+    feedback = await set_feedback_approved(feedback=feedback, is_approved=True, db=db)
+    audit_trail.record('feedback.approve', actor=user, target_type='feedback', target_id=f_id)
+    public_feed.invalidate()
+    return feedback
 
 
 @router.get(
@@ -93,10 +120,83 @@ async def get_moderation_settings(
 async def patch_moderation_settings(
     payload: ModerationSettingsUpdate,
     db: AsyncSession = Depends(get_db),
-    _user=Depends(get_current_user),
+    user=Depends(get_current_user),
 ):
-    return await update_moderation_settings(
+    moderation_settings = await update_moderation_settings(
         db,
         auto_approve_enabled=payload.auto_approve_enabled,
         manual_review_rating_threshold=payload.manual_review_rating_threshold,
     )
+    audit_trail.record(
+        'moderation.update',
+        actor=user,
+        target_type='moderation_settings',
+        target_id=moderation_settings.id,
+        **payload.model_dump(exclude_unset=True),
+    )
+    return moderation_settings
+
+
+@router.post(
+    path='/admin/import',
+    response_model=FeedbackImportReport,
+)
+async def import_feedback_file(
+    file: UploadFile = File(...),
+    format: ImportFormat | None = Query(default=None),
+    source: str | None = Query(default=None, max_length=150),
+    db: AsyncSession = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    fmt = format or detect_format(file.filename)
+    if fmt is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Cannot detect file format, pass ?format=csv or ?format=ndjson',
+        )
+    # UploadFile is already spooled to a temporary file, so rows are read from it incrementally.
+    stream = io.TextIOWrapper(file.file, encoding='utf-8-sig', newline='')
+    try:
+        report = await import_feedback(db, stream, fmt, source=source)
+    finally:
+        stream.detach()
+    audit_trail.record(
+        'feedback.import',
+        actor=user,
+        filename=file.filename,
+        source=source,
+        inserted=report.inserted,
+        failed=report.failed,
+    )
+    if report.inserted:
+        public_feed.invalidate()
+    return report
+
+
+@router.get(
+    path='/admin/trends',
+    response_model=TrendReport,
+)
+async def feedback_trends(
+    days: int = Query(default=7, ge=1, le=90),
+    baseline_days: int = Query(default=28, ge=1, le=365),
+    limit: int = Query(default=20, ge=1, le=100),
+    min_count: int = Query(default=3, ge=1),
+    db: AsyncSession = Depends(get_db),
+    _user=Depends(get_current_user),
+):
+    # Reads the per-day term counters only; counts from the last few seconds may still be in memory.
+    today = datetime.now(timezone.utc).date()
+    key = (today, days, baseline_days, limit, min_count)
+    report = trend_counter.cached_report(key)
+    if report is None:
+        report = await get_trend_report(
+            db,
+            today=today,
+            days=days,
+            baseline_days=baseline_days,
+            limit=limit,
+            min_count=min_count,
+        )
+        trend_counter.store_report(key, report)
+    return report
@@ -0,0 +1,233 @@
+import asyncio
+import fcntl
+import json
+import logging
+import os
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+from typing import IO, Any, Protocol
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from models.audit_log import AuditLog
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class AuditEvent:
+    action : str
+    actor_id : int | None
+    actor_email : str | None
+    target_type : str | None
+    target_id : int | None
+    details : dict[str, Any] = field(default_factory=dict)
+    created_at : datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class AuditSink(Protocol):
+    async def write(self, events : list[AuditEvent]) -> None: ...
+
+
+class DatabaseAuditSink:
+    def __init__(self, session_factory : async_sessionmaker[AsyncSession]) -> None:
+        self.session_factory = session_factory
+
+    async def write(self, events : list[AuditEvent]) -> None:
+        rows = [
+            {
+                'created_at': e.created_at,
+                'actor_id': e.actor_id,
+                'actor_email': e.actor_email,
+                'action': e.action,
+                'target_type': e.target_type,
+                'target_id': e.target_id,
+                'details': json.dumps(e.details, ensure_ascii=False, default=str),
+            }
+            for e in events
+        ]
+        async with self.session_factory() as db:
+            # One executemany per batch through Core, no ORM unit of work.
+            await db.execute(insert(AuditLog.__table__), rows)
+            await db.commit()
+
+
+def claim_worker_slot(path : str) -> tuple[str, IO]:
+    """Lowest free slot for `path`: `audit.log` -> `audit.0.log`, `audit.1.log`, ...
+
+    Workers rotating one shared file overwrite each other's lines, so each gets
+    its own. A slot is held by a lock on `<file>.lock` that the OS drops when the
+    process dies, so a restarted worker reuses its predecessor's files and the
+    number of files stays bounded by the number of live workers.
+    """
+    root, ext = os.path.splitext(path)
+    slot = 0
+    while True:
+        slot_path = f'{root}.{slot}{ext}'
+        lock = open(f'{slot_path}.lock', 'a')
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock.close()
+            slot += 1
+            continue
+        return slot_path, lock
+
+
+class FileAuditSink:
+    """JSON lines in a size-rotated local file per worker, for deployments that ship logs elsewhere."""
+
+    def __init__(self, path : str, max_bytes : int, backup_count : int) -> None:
+        self.path, self._slot_lock = claim_worker_slot(path)
+        self.handler = RotatingFileHandler(self.path, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
+        self.handler.setFormatter(logging.Formatter('%(message)s'))
+
+    def _write(self, events : list[AuditEvent]) -> None:
+        for e in events:
+            line = json.dumps(asdict(e), ensure_ascii=False, default=str)
+            self.handler.emit(logging.makeLogRecord({'msg': line, 'levelno': logging.INFO}))
+        self.handler.flush()
+
+    async def write(self, events : list[AuditEvent]) -> None:
+        await asyncio.to_thread(self._write, events)
+
+    def close(self) -> None:
+        self.handler.close()
+        self._slot_lock.close()
+
+
+class AuditTrail:
+    """Bounded in-process buffer of audit events, written in batches by a background task.
+
+    `record` is synchronous and O(1), so handlers never wait on the audit
+    write. Events leave the buffer only after the sink accepted them; a failed
+    batch goes back to the front and is retried on the next flush. When the
+    buffer is full the oldest events are dropped and counted in `dropped`.
+    """
+
+    def __init__(self, max_buffer : int = 10000, batch_size : int = 200, flush_interval : float = 2.0) -> None:
+        self.sink : AuditSink | None = None
+        self.enabled = True
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._buffer : deque[AuditEvent] = deque(maxlen=max_buffer)
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task : asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def configure(
+        self,
+        *,
+        sink : AuditSink | None,
+        max_buffer : int,
+        batch_size : int,
+        flush_interval : float,
+    ) -> None:
+        self.sink = sink
+        self.enabled = sink is not None
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buffer = deque(self._buffer, maxlen=max_buffer)
+
+    def record(
+        self,
+        action : str,
+        *,
+        actor = None,
+        target_type : str | None = None,
+        target_id : int | None = None,
+        **details : Any,
+    ) -> None:
+        if not self.enabled:
+            return
+        if self._buffer.maxlen is not None and len(self._buffer) >= self._buffer.maxlen:
+            self.dropped += 1
+        self._buffer.append(AuditEvent(
+            action=action,
+            actor_id=getattr(actor, 'id', None),
+            actor_email=getattr(actor, 'email', None),
+            target_type=target_type,
+            target_id=target_id,
+            details=details,
+        ))
+        if len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    async def flush(self) -> int:
+        """Write everything buffered so far; returns the number of events written."""
+        if self.sink is None:
+            return 0
+        written = 0
+        async with self._flush_lock:
+            while self._buffer:
+                batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+                try:
+                    await self.sink.write(batch)
+                except asyncio.CancelledError:
+                    # The batch may or may not have landed; keeping it makes delivery at-least-once.
+                    self._requeue(batch)
+                    raise
+                except Exception:
+                    self._requeue(batch)
+                    logger.exception('Failed to write %d audit events, will retry', len(batch))
+                    break
+                written += len(batch)
+        return written
+
+    def _requeue(self, batch : list[AuditEvent]) -> None:
+        # Events recorded while the batch was out may have filled the buffer. Appending
+        # on the left of a full deque would push the newest events out on the right
+        # uncounted, so drop the oldest (the front of the batch) and count them.
+        if self._buffer.maxlen is not None:
+            overflow = len(self._buffer) + len(batch) - self._buffer.maxlen
+            if overflow > 0:
+                self.dropped += overflow
+                batch = batch[overflow:]
+        self._buffer.extendleft(reversed(batch))
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    def start(self) -> None:
+        if self._task is not None or self.sink is None:
+            return
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        # Final flush so a clean shutdown does not lose buffered events.
+        await self.flush()
+        if self._buffer:
+            logger.error('Shutting down with %d unwritten audit events', len(self._buffer))
+        if isinstance(self.sink, FileAuditSink):
+            self.sink.close()
+
+    def clear(self) -> None:
+        self._buffer.clear()
+        self.dropped = 0
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+
+
+audit_trail = AuditTrail()
@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -8,8 +9,55 @@ class Settings(BaseSettings):
     JWT_SECRET_KEY : str
     JWT_ALG : str
     ACCESS_TOKEN_EXPIRE_MINUTES : int = 30
+    REFRESH_TOKEN_EXPIRE_DAYS : int = 14
     ADMIN_BOOTSTRAP_SECRET : str | None = None
     CORS_ORIGINS : str | None = None
+    PUBLIC_FEED_LIMIT : int = 200
+    PUBLIC_FEED_REFRESH_SECONDS : float = 30.0
+    # How often each worker checks whether another worker changed the feed.
+    PUBLIC_FEED_VERSION_POLL_SECONDS : float = 1.0
+    IDEMPOTENCY_TTL_SECONDS : int = 86400
+    IDEMPOTENCY_MAX_ENTRIES : int = 10000
+    # Unset: on unless WEB_CONCURRENCY=1. Workers do not share memory, so a retry
+    # that lands on another worker is only caught by the shared table.
+    IDEMPOTENCY_DB_ENABLED : bool | None = None
+    # A running request extends its reservation every third of this; one left unextended this long
+    # (dead worker) is taken over. Duplicates wait up to this long before getting 409.
+    IDEMPOTENCY_LOCK_SECONDS : float = 30.0
+    HOST : str = '0.0.0.0'
+    PORT : int = 8000
+    # 0 = one per CPU available to the container (affinity and cgroup quota).
+    WEB_CONCURRENCY : int = 1
+    GRACEFUL_SHUTDOWN_SECONDS : int = 20
+    DB_POOL_SIZE : int = 5
+    DB_MAX_OVERFLOW : int = 5
+    WARMUP_POOL_CONNECTIONS : int = 2
+    STARTUP_BUDGET_SECONDS : float = 10.0
+    HEALTH_CACHE_SECONDS : float = 2.0
+    HEALTH_DB_TIMEOUT_SECONDS : float = 2.0
+    HEALTH_MAX_LOOP_LAG_MS : float = 1000.0
+    HEALTH_LOOP_LAG_INTERVAL_MS : float = 100.0
+    HEALTH_LOOP_LAG_WINDOW_SECONDS : float = 10.0
+    LOAD_SHED_ENABLED : bool = True
+    LOAD_SHED_INITIAL_LIMIT : int = 20
+    LOAD_SHED_MIN_LIMIT : int = 4
+    LOAD_SHED_MAX_LIMIT : int = 100
+    LOAD_SHED_LATENCY_TARGET_MS : float = 250.0
+    LOAD_SHED_RETRY_AFTER_SECONDS : int = 1
+    AUDIT_SINK : Literal['db', 'file', 'off'] = 'db'
+    AUDIT_FILE_PATH : str = 'audit.log'
+    AUDIT_FILE_MAX_BYTES : int = 10 * 1024 * 1024
+    AUDIT_FILE_BACKUP_COUNT : int = 5
+    AUDIT_BUFFER_SIZE : int = 10000
+    AUDIT_BATCH_SIZE : int = 200
+    AUDIT_FLUSH_SECONDS : float = 2.0
+    TRENDS_ENABLED : bool = True
+    TRENDS_FLUSH_SECONDS : float = 10.0
+
+    def idempotency_db_enabled(self) -> bool:
+        if self.IDEMPOTENCY_DB_ENABLED is not None:
+            return self.IDEMPOTENCY_DB_ENABLED
+        return self.WEB_CONCURRENCY != 1
 
 @lru_cache
 def get_settings() -> Settings:
@@ -0,0 +1,142 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+@dataclass(frozen=True, slots=True)
+class ProbeResult:
+    ok : bool
+    checks : dict[str, Any]
+    checked_at : float
+
+
+class LoopLagMonitor:
+    """Background heartbeat that records how late `asyncio.sleep(interval)` wakes up.
+
+    A probe that only measures its own scheduling delay misses a handler that
+    blocked the loop a second ago and has since returned; the heartbeat sees
+    every such stall. `max_lag()` is the worst overshoot within `window` seconds,
+    including the sleep still pending.
+    """
+
+    def __init__(self, interval : float = 0.1, window : float = 10.0) -> None:
+        self.interval = interval
+        self.window = window
+        self._samples : deque[tuple[float, float]] = deque()
+        self._sleep_started : float | None = None
+        self._task : asyncio.Task | None = None
+
+    def configure(self, *, interval : float, window : float) -> None:
+        self.interval = interval
+        self.window = window
+
+    def _record(self, now : float, lag : float) -> None:
+        self._samples.append((now, lag))
+        while self._samples and now - self._samples[0][0] > self.window:
+            self._samples.popleft()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._sleep_started = loop.time()
+            await asyncio.sleep(self.interval)
+            now = loop.time()
+            self._record(now, max(0.0, now - self._sleep_started - self.interval))
+
+    def max_lag(self) -> float:
+        now = asyncio.get_running_loop().time()
+        lags = [lag for at, lag in self._samples if now - at <= self.window]
+        if self._sleep_started is not None:
+            lags.append(max(0.0, now - self._sleep_started - self.interval))
+        return max(lags, default=0.0)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._sleep_started = None
+
+    def clear(self) -> None:
+        self._samples.clear()
+
+
+async def measure_loop_lag() -> float:
+    """Worst loop stall seen by the heartbeat, or this task's own scheduling delay if it is not running."""
+    if loop_lag_monitor.running:
+        return loop_lag_monitor.max_lag()
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await asyncio.sleep(0)
+    return loop.time() - started
+
+
+def pool_stats(engine : AsyncEngine) -> dict[str, int] | None:
+    pool = engine.pool
+    if not hasattr(pool, 'checkedout'):
+        return None
+    return {
+        'size': pool.size(),
+        'checked_out': pool.checkedout(),
+        'overflow': pool.overflow(),
+        'checked_in': pool.checkedin(),
+    }
+
+
+async def check_database(engine : AsyncEngine, timeout : float) -> dict[str, Any]:
+    started = time.perf_counter()
+    try:
+        async with asyncio.timeout(timeout):
+            async with engine.connect() as conn:
+                await conn.execute(text('SELECT 1'))
+    except Exception as e:
+        return {'ok': False, 'error': type(e).__name__}
+    return {'ok': True, 'latency_ms': round((time.perf_counter() - started) * 1000, 2)}
+
+
+class CachedProbe:
+    """Runs a probe at most once per `ttl`; concurrent callers share one in-flight run."""
+
+    def __init__(self, ttl : float = 2.0) -> None:
+        self.ttl = ttl
+        self._result : ProbeResult | None = None
+        self._inflight : asyncio.Future | None = None
+
+    async def get(self, probe) -> ProbeResult:
+        result = self._result
+        if result is not None and time.monotonic() - result.checked_at < self.ttl:
+            return result
+        if self._inflight is None:
+            self._inflight = asyncio.ensure_future(probe())
+            self._inflight.add_done_callback(self._store)
+        return await asyncio.shield(self._inflight)
+
+    def _store(self, future : asyncio.Future) -> None:
+        self._inflight = None
+        if not future.cancelled() and future.exception() is None:
+            self._result = future.result()
+
+    def clear(self) -> None:
+        self._result = None
+        self._inflight = None
+
+
+loop_lag_monitor = LoopLagMonitor()
+liveness_probe = CachedProbe()
+readiness_probe = CachedProbe()
@@ -0,0 +1,493 @@
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from urllib.parse import parse_qsl
+
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser, parse_options_header
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from models.idempotency_key import IdempotencyKey
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = 'idempotency-key'
+MAX_KEY_LENGTH = 255
+# `status_code` of a row reserved by a request that is still running.
+PENDING_STATUS = 0
+
+IDEMPOTENT_ROUTES : tuple[tuple[str, re.Pattern[str]], ...] = (
+    ('POST', re.compile(r'^/api/v1/feedback/create$')),
+    ('PATCH', re.compile(r'^/api/v1/feedback/admin/\d+/approve$')),
+    ('DELETE', re.compile(r'^/api/v1/feedback/delete/\d+$')),
+    ('POST', re.compile(r'^/api/v1/feedback/admin/import$')),
+    ('POST', re.compile(r'^/api/v1/admin/create$')),
+    ('DELETE', re.compile(r'^/api/v1/admin/delete/\d+$')),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class StoredResponse:
+    fingerprint : str
+    status : int
+    headers : tuple[tuple[bytes, bytes], ...]
+    body : bytes
+    expires_at : float
+
+
+class MemoryIdempotencyStore:
+    def __init__(self, ttl : float, max_entries : int) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries : OrderedDict[str, StoredResponse] = OrderedDict()
+
+    async def get(self, key : str) -> StoredResponse | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.time():
+            del self._entries[key]
+            return None
+        return entry
+
+    async def put(self, key : str, response : StoredResponse) -> None:
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        now = time.time()
+        # Entries share one TTL, so insertion order is expiry order.
+        while self._entries:
+            oldest = next(iter(self._entries.values()))
+            if oldest.expires_at > now and len(self._entries) <= self.max_entries:
+                break
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class IdempotencyKeyInProgress(Exception):
+    pass
+
+
+def _expires_at(row : IdempotencyKey) -> float:
+    # SQLite hands back naive datetimes; the column is always written in UTC.
+    return row.expires_at.replace(tzinfo=timezone.utc).timestamp()
+
+
+def _utc(timestamp : float) -> datetime:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+
+class DatabaseIdempotencyStore:
+    """Shared across workers; a pending row is the cross-process lock for its key."""
+
+    def __init__(self, session_factory : async_sessionmaker[AsyncSession], lock_seconds : float = 30) -> None:
+        self.session_factory = session_factory
+        self.lock_seconds = lock_seconds
+
+    async def _load(self, db : AsyncSession, key : str) -> IdempotencyKey | None:
+        res = await db.execute(select(IdempotencyKey).where(IdempotencyKey.key == key))
+        return res.scalar_one_or_none()
+
+    async def get(self, key : str) -> StoredResponse | None:
+        async with self.session_factory() as db:
+            row = await self._load(db, key)
+        if row is None or row.status_code == PENDING_STATUS or _expires_at(row) <= time.time():
+            return None
+        return self._to_response(row)
+
+    async def reserve(self, key : str) -> StoredResponse | None:
+        """Claim `key` for this request, or return the response stored by whoever claimed it first.
+
+        Returns None once the pending row is ours. If another worker holds a live
+        reservation, waits for its response for up to `lock_seconds` and then raises
+        IdempotencyKeyInProgress. The owner keeps extending its reservation (see
+        `extend`) while the request runs; one that stops being extended for
+        `lock_seconds` belongs to a dead worker and is taken over.
+        """
+        deadline = time.monotonic() + self.lock_seconds
+        delay = 0.05
+        while True:
+            async with self.session_factory() as db:
+                try:
+                    await db.execute(insert(IdempotencyKey).values(
+                        key=key,
+                        fingerprint='',
+                        status_code=PENDING_STATUS,
+                        headers='[]',
+                        body=b'',
+                        expires_at=_utc(time.time() + self.lock_seconds),
+                    ))
+                    await db.commit()
+                    return None
+                except IntegrityError:
+                    await db.rollback()
+
+                row = await self._load(db, key)
+                if row is not None and _expires_at(row) <= time.time():
+                    # Stale response or abandoned reservation: take the key over. The
+                    # condition is checked by the database, not against the loaded row.
+                    await db.execute(
+                        delete(IdempotencyKey)
+                        .where(IdempotencyKey.key == key, IdempotencyKey.expires_at <= _utc(time.time()))
+                        .execution_options(synchronize_session=False)
+                    )
+                    await db.commit()
+                    continue
+            if row is not None and row.status_code != PENDING_STATUS:
+                return self._to_response(row)
+            if row is not None and time.monotonic() >= deadline:
+                raise IdempotencyKeyInProgress(key)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.5)
+
+    async def extend(self, key : str) -> None:
+        """Push back the expiry of our pending reservation so waiters do not take it over."""
+        async with self.session_factory() as db:
+            await db.execute(
+                update(IdempotencyKey)
+                .where(IdempotencyKey.key == key, IdempotencyKey.status_code == PENDING_STATUS)
+                .values(expires_at=_utc(time.time() + self.lock_seconds))
+            )
+            await db.commit()
+
+    async def release(self, key : str) -> None:
+        async with self.session_factory() as db:
+            await db.execute(delete(IdempotencyKey).where(
+                IdempotencyKey.key == key,
+                IdempotencyKey.status_code == PENDING_STATUS,
+            ))
+            await db.commit()
+
+    def _to_response(self, row : IdempotencyKey) -> StoredResponse:
+        return StoredResponse(
+            fingerprint=row.fingerprint,
+            status=row.status_code,
+            headers=tuple((k.encode('latin-1'), v.encode('latin-1')) for k, v in json.loads(row.headers)),
+            body=row.body,
+            expires_at=_expires_at(row),
+        )
+
+    async def put(self, key : str, response : StoredResponse) -> None:
+        async with self.session_factory() as db:
+            # Piggyback expiry on writes; `expires_at` is indexed so this stays cheap.
+            await db.execute(delete(IdempotencyKey).where(
+                (IdempotencyKey.key == key) | (IdempotencyKey.expires_at <= _utc(time.time()))
+            ))
+            db.add(IdempotencyKey(
+                key=key,
+                fingerprint=response.fingerprint,
+                status_code=response.status,
+                headers=json.dumps([(k.decode('latin-1'), v.decode('latin-1')) for k, v in response.headers]),
+                body=response.body,
+                expires_at=_utc(response.expires_at),
+            ))
+            await db.commit()
+
+
+class IdempotencyStore:
+    """In-memory response cache with an optional shared table behind it."""
+
+    def __init__(self, ttl : float = 86400, max_entries : int = 10000) -> None:
+        self.memory = MemoryIdempotencyStore(ttl=ttl, max_entries=max_entries)
+        self.database : DatabaseIdempotencyStore | None = None
+        self._locks : dict[str, tuple[asyncio.Lock, int]] = {}
+
+    @property
+    def ttl(self) -> float:
+        return self.memory.ttl
+
+    def configure(
+        self,
+        *,
+        ttl : float,
+        max_entries : int,
+        session_factory : async_sessionmaker[AsyncSession] | None = None,
+        lock_seconds : float = 30,
+    ) -> None:
+        self.memory.ttl = ttl
+        self.memory.max_entries = max_entries
+        self.database = None
+        if session_factory is not None:
+            self.database = DatabaseIdempotencyStore(session_factory, lock_seconds=lock_seconds)
+
+    @asynccontextmanager
+    async def lock(self, key : str):
+        lock, waiters = self._locks.get(key, (None, 0))
+        if lock is None:
+            lock = asyncio.Lock()
+        self._locks[key] = (lock, waiters + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, waiters = self._locks[key]
+            if waiters == 1:
+                del self._locks[key]
+            else:
+                self._locks[key] = (lock, waiters - 1)
+
+    async def get(self, key : str) -> StoredResponse | None:
+        response = await self.memory.get(key)
+        if response is None and self.database is not None:
+            response = await self.database.get(key)
+            if response is not None:
+                await self.memory.put(key, response)
+        return response
+
+    async def reserve(self, key : str) -> StoredResponse | None:
+        if self.database is None:
+            return None
+        response = await self.database.reserve(key)
+        if response is not None:
+            await self.memory.put(key, response)
+        return response
+
+    async def _keep_reserved(self, key : str) -> None:
+        while True:
+            await asyncio.sleep(self.database.lock_seconds / 3)
+            try:
+                await self.database.extend(key)
+            except Exception:
+                logger.exception('Failed to extend idempotency reservation')
+
+    @asynccontextmanager
+    async def hold(self, key : str):
+        """Keep this worker's reservation of `key` alive for as long as the block runs."""
+        if self.database is None:
+            yield
+            return
+        task = asyncio.create_task(self._keep_reserved(key))
+        try:
+            yield
+        finally:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def release(self, key : str) -> None:
+        if self.database is not None:
+            try:
+                await self.database.release(key)
+            except Exception:
+                logger.exception('Failed to release idempotency key')
+
+    async def put(self, key : str, response : StoredResponse) -> None:
+        await self.memory.put(key, response)
+        if self.database is not None:
+            try:
+                await self.database.put(key, response)
+            except Exception:
+                logger.exception('Failed to persist idempotency key')
+
+    def clear(self) -> None:
+        self.memory.clear()
+        self._locks.clear()
+
+
+idempotency_store = IdempotencyStore()
+
+
+def _is_idempotent_route(method : str, path : str) -> bool:
+    return any(method == m and pattern.match(path) for m, pattern in IDEMPOTENT_ROUTES)
+
+
+async def _send_json(send, status : int, detail : str) -> None:
+    body = json.dumps({'detail': detail}).encode('utf-8')
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode())],
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+class BodyFingerprint:
+    """sha256 of the raw request body."""
+
+    def __init__(self) -> None:
+        self._hash = hashlib.sha256()
+
+    def update(self, chunk : bytes) -> None:
+        self._hash.update(chunk)
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+class MultipartFingerprint:
+    """Hash of each part's headers and content plus the query string, without the boundary.
+
+    Clients pick a fresh random boundary for every request, so the raw body of a
+    retried upload never matches the original.
+    """
+
+    def __init__(self, boundary : bytes, query_string : bytes) -> None:
+        self._hash = hashlib.sha256(b'multipart\0')
+        for name, value in sorted(parse_qsl(query_string.decode('latin-1'), keep_blank_values=True)):
+            self._hash.update(f'{name}={value}\0'.encode())
+        self._raw = hashlib.sha256()
+        self._part = hashlib.sha256()
+        self._header_field = bytearray()
+        self._header_value = bytearray()
+        self._parser : MultipartParser | None = MultipartParser(boundary, {
+            'on_part_begin': self._on_part_begin,
+            'on_header_field': self._on_header_field,
+            'on_header_value': self._on_header_value,
+            'on_header_end': self._on_header_end,
+            'on_part_data': self._on_part_data,
+            'on_part_end': self._on_part_end,
+        })
+
+    def _on_part_begin(self) -> None:
+        self._part = hashlib.sha256()
+
+    def _on_header_field(self, data : bytes, start : int, end : int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data : bytes, start : int, end : int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        # Headers arrive in arbitrary chunks; hash each one whole so the split does not matter.
+        self._hash.update(bytes(self._header_field).lower() + b'\0' + bytes(self._header_value) + b'\n')
+        self._header_field.clear()
+        self._header_value.clear()
+
+    def _on_part_data(self, data : bytes, start : int, end : int) -> None:
+        self._part.update(data[start:end])
+
+    def _on_part_end(self) -> None:
+        self._hash.update(self._part.digest())
+
+    def update(self, chunk : bytes) -> None:
+        self._raw.update(chunk)
+        if self._parser is None:
+            return
+        try:
+            self._parser.write(chunk)
+        except MultipartParseError:
+            # The endpoint rejects it anyway; fall back to the raw body.
+            self._parser = None
+
+    def hexdigest(self) -> str:
+        if self._parser is None:
+            return self._raw.hexdigest()
+        return self._hash.hexdigest()
+
+
+def _fingerprint(scope, headers : dict[bytes, bytes]) -> BodyFingerprint | MultipartFingerprint:
+    content_type, options = parse_options_header(headers.get(b'content-type', b''))
+    if content_type == b'multipart/form-data' and options.get(b'boundary'):
+        return MultipartFingerprint(options[b'boundary'], scope.get('query_string', b''))
+    return BodyFingerprint()
+
+
+class IdempotencyMiddleware:
+    """Replays the stored response for retried mutations carrying an `Idempotency-Key` header."""
+
+    def __init__(self, app, store : IdempotencyStore = idempotency_store) -> None:
+        self.app = app
+        self.store = store
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope['type'] != 'http' or not _is_idempotent_route(scope['method'], scope['path']):
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope['headers'])
+        raw_key = headers.get(IDEMPOTENCY_HEADER.encode())
+        if raw_key is None:
+            await self.app(scope, receive, send)
+            return
+        if not raw_key or len(raw_key) > MAX_KEY_LENGTH:
+            await _send_json(send, 400, 'Invalid Idempotency-Key header')
+            return
+
+        # Keys are scoped to the route and caller so one client cannot replay another's response.
+        scoped = hashlib.sha256()
+        for part in (scope['method'].encode(), scope['path'].encode(), headers.get(b'authorization', b''), raw_key):
+            scoped.update(part)
+            scoped.update(b'\0')
+        key = scoped.hexdigest()
+
+        # The in-process lock serializes duplicates within this worker; the
+        # database reservation serializes them across workers.
+        async with self.store.lock(key):
+            stored = await self.store.get(key)
+            if stored is None:
+                try:
+                    stored = await self.store.reserve(key)
+                except IdempotencyKeyInProgress:
+                    await _send_json(send, 409, 'A request with this Idempotency-Key is still in progress')
+                    return
+            if stored is not None:
+                await self._replay(stored, _fingerprint(scope, headers), receive, send)
+                return
+            await self._execute(key, scope, _fingerprint(scope, headers), receive, send)
+
+    async def _replay(self, stored : StoredResponse, body_hash : BodyFingerprint | MultipartFingerprint, receive, send) -> None:
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return
+            body_hash.update(message.get('body', b''))
+            more_body = message.get('more_body', False)
+        if body_hash.hexdigest() != stored.fingerprint:
+            await _send_json(send, 422, 'Idempotency-Key was already used with a different request body')
+            return
+        await send({
+            'type': 'http.response.start',
+            'status': stored.status,
+            'headers': [*stored.headers, (b'idempotent-replayed', b'true')],
+        })
+        await send({'type': 'http.response.body', 'body': stored.body})
+
+    async def _execute(self, key : str, scope, body_hash : BodyFingerprint | MultipartFingerprint, receive, send) -> None:
+        response_start : dict | None = None
+        chunks : list[bytes] = []
+
+        async def hashing_receive():
+            message = await receive()
+            if message['type'] == 'http.request':
+                body_hash.update(message.get('body', b''))
+            return message
+
+        async def capturing_send(message):
+            nonlocal response_start
+            if message['type'] == 'http.response.start':
+                response_start = message
+            elif message['type'] == 'http.response.body':
+                chunks.append(message.get('body', b''))
+            await send(message)
+
+        try:
+            async with self.store.hold(key):
+                await self.app(scope, hashing_receive, capturing_send)
+        except BaseException:
+            await self.store.release(key)
+            raise
+
+        # Server errors are not cached so the client can retry them.
+        if response_start is None or response_start['status'] >= 500:
+            await self.store.release(key)
+            return
+        await self.store.put(key, StoredResponse(
+            fingerprint=body_hash.hexdigest(),
+            status=response_start['status'],
+            headers=tuple((bytes(k), bytes(v)) for k, v in response_start.get('headers', ())),
+            body=b''.join(chunks),
+            expires_at=time.time() + self.store.ttl,
+        ))
@@ -0,0 +1,241 @@
+import asyncio
+import json
+import math
+import re
+import time
+from collections import deque
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class RouteClass:
+    name : str
+    # Lower value is served first when a slot frees up.
+    priority : int
+    # Share of the adaptive limit this class may hold at once.
+    max_share : float
+    max_queue : int
+    queue_timeout : float
+
+
+# Guests submitting feedback matter most, then moderation, then list polling
+# (which is served from the feed snapshot and is cheap to retry).
+ROUTE_CLASSES : tuple[RouteClass, ...] = (
+    RouteClass('submit', priority=0, max_share=1.0, max_queue=200, queue_timeout=5.0),
+    RouteClass('admin', priority=1, max_share=0.6, max_queue=50, queue_timeout=2.0),
+    RouteClass('public', priority=2, max_share=0.5, max_queue=100, queue_timeout=0.5),
+)
+
+# First match wins. Anything unmatched (health probes, docs) is not limited.
+SHED_ROUTES : tuple[tuple[str, re.Pattern[str], str], ...] = (
+    ('POST', re.compile(r'^/api/v1/feedback/create$'), 'submit'),
+    ('GET', re.compile(r'^/api/v1/feedback/?$'), 'public'),
+    ('*', re.compile(r'^/api/v1/feedback/(admin|delete)(/|$)'), 'admin'),
+    ('*', re.compile(r'^/api/v1/admin(/|$)'), 'admin'),
+)
+
+
+def classify(method : str, path : str) -> str | None:
+    for m, pattern, name in SHED_ROUTES:
+        if (m == '*' or m == method) and pattern.match(path):
+            return name
+    return None
+
+
+class AdaptiveLimit:
+    """AIMD concurrency limit driven by request latency.
+
+    Every sample under the target grows the limit by 1/limit (about +1 per
+    round of requests) while the limit is actually in use; a sample over the
+    target shrinks it by `backoff`, at most once per target interval so a
+    single burst of slow responses does not collapse it to the floor.
+    """
+
+    def __init__(
+        self,
+        initial : int = 20,
+        min_limit : int = 4,
+        max_limit : int = 100,
+        latency_target : float = 0.25,
+        backoff : float = 0.9,
+    ) -> None:
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.backoff = backoff
+        self._limit = float(min(max(initial, min_limit), max_limit))
+        self._last_decrease = 0.0
+
+    @property
+    def value(self) -> int:
+        return int(self._limit)
+
+    def update(self, latency : float, inflight : int) -> None:
+        if latency > self.latency_target:
+            now = time.monotonic()
+            if now - self._last_decrease >= self.latency_target:
+                self._limit = max(self.min_limit, self._limit * self.backoff)
+                self._last_decrease = now
+        elif inflight * 2 >= self._limit:
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+
+
+class LoadShedder:
+    """Admits requests under a shared adaptive limit, queueing by route class priority."""
+
+    def __init__(self, classes : tuple[RouteClass, ...] = ROUTE_CLASSES) -> None:
+        self.enabled = True
+        self.retry_after = 1
+        self.classes = {c.name: c for c in classes}
+        self._order = sorted(classes, key=lambda c: c.priority)
+        self.limit = AdaptiveLimit()
+        self._inflight = 0
+        self._class_inflight = dict.fromkeys(self.classes, 0)
+        self._queues : dict[str, deque[asyncio.Future]] = {name: deque() for name in self.classes}
+        self.rejected = dict.fromkeys(self.classes, 0)
+
+    def configure(
+        self,
+        *,
+        enabled : bool,
+        initial_limit : int,
+        min_limit : int,
+        max_limit : int,
+        latency_target : float,
+        retry_after : int,
+    ) -> None:
+        self.enabled = enabled
+        self.retry_after = retry_after
+        self.limit = AdaptiveLimit(initial_limit, min_limit, max_limit, latency_target)
+
+    def _class_cap(self, route_class : RouteClass) -> int:
+        return max(1, math.ceil(self.limit.value * route_class.max_share))
+
+    def _has_room(self, route_class : RouteClass) -> bool:
+        return (
+            self._inflight < self.limit.value
+            and self._class_inflight[route_class.name] < self._class_cap(route_class)
+        )
+
+    def _admit(self, name : str) -> None:
+        self._inflight += 1
+        self._class_inflight[name] += 1
+
+    def _queued_ahead(self, route_class : RouteClass) -> bool:
+        # Waiters held back by their own class cap cannot take a free slot, so they
+        # must not hold back lower classes either.
+        return any(
+            self._queues[c.name] and self._has_room(c)
+            for c in self._order
+            if c.priority <= route_class.priority
+        )
+
+    async def acquire(self, name : str) -> bool:
+        route_class = self.classes[name]
+        if self._has_room(route_class) and not self._queued_ahead(route_class):
+            self._admit(name)
+            return True
+
+        queue = self._queues[name]
+        if len(queue) >= route_class.max_queue:
+            self.rejected[name] += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        queue.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), route_class.queue_timeout)
+            return True
+        except TimeoutError:
+            if waiter.done():
+                # Handed a slot in the same tick the deadline fired.
+                return True
+            queue.remove(waiter)
+            waiter.cancel()
+            self.rejected[name] += 1
+            return False
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release(name, None)
+            elif waiter in queue:
+                queue.remove(waiter)
+                waiter.cancel()
+            raise
+
+    def release(self, name : str, latency : float | None) -> None:
+        self._inflight -= 1
+        self._class_inflight[name] -= 1
+        if latency is not None:
+            self.limit.update(latency, self._inflight)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        # Slots are handed over directly so a newly arriving request cannot jump the
+        # queue. Classes at their cap are skipped and the slot goes further down.
+        while self._inflight < self.limit.value:
+            for route_class in self._order:
+                queue = self._queues[route_class.name]
+                if queue and self._has_room(route_class):
+                    self._admit(route_class.name)
+                    queue.popleft().set_result(None)
+                    break
+            else:
+                return
+
+    def stats(self) -> dict:
+        return {
+            'enabled': self.enabled,
+            'limit': self.limit.value,
+            'inflight': self._inflight,
+            'queued': {name: len(queue) for name, queue in self._queues.items()},
+            'rejected': dict(self.rejected),
+        }
+
+    def clear(self) -> None:
+        for queue in self._queues.values():
+            for waiter in queue:
+                waiter.cancel()
+            queue.clear()
+        self._inflight = 0
+        self._class_inflight = dict.fromkeys(self.classes, 0)
+        self.rejected = dict.fromkeys(self.classes, 0)
+
+
+load_shedder = LoadShedder()
+
+
+class LoadSheddingMiddleware:
+    """Rejects with 503 + Retry-After instead of letting requests pile up on a slow database."""
+
+    def __init__(self, app, shedder : LoadShedder = load_shedder) -> None:
+        self.app = app
+        self.shedder = shedder
+
+    async def __call__(self, scope, receive, send) -> None:
+        name = classify(scope['method'], scope['path']) if scope['type'] == 'http' else None
+        if name is None or not self.shedder.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        if not await self.shedder.acquire(name):
+            body = json.dumps({'detail': 'Server is busy, please retry'}).encode('utf-8')
+            await send({
+                'type': 'http.response.start',
+                'status': 503,
+                'headers': [
+                    (b'content-type', b'application/json'),
+                    (b'content-length', str(len(body)).encode()),
+                    (b'retry-after', str(self.shedder.retry_after).encode()),
+                ],
+            })
+            await send({'type': 'http.response.body', 'body': body})
+            return
+
+        started = time.perf_counter()
+        latency = None
+        try:
+            await self.app(scope, receive, send)
+            latency = time.perf_counter() - started
+        finally:
+            # Failed requests release their slot but do not feed the limit.
+            self.shedder.release(name, latency)
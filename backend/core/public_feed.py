@@ -0,0 +1,163 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from crud.feed_version import bump_feed_version, get_feed_version
+from crud.feedback import approved_feedback_stmt
+from schemas.feedback import FeedbackOut
+
+logger = logging.getLogger(__name__)
+
+FEED_VERSION_NAME = 'public'
+
+
+@dataclass(frozen=True, slots=True)
+class FeedSnapshot:
+    body : bytes
+    gzip_body : bytes
+    etag : str
+    built_at : float
+
+
+def build_snapshot(feedbacks) -> FeedSnapshot:
+    items = [FeedbackOut.model_validate(f).model_dump(mode='json') for f in feedbacks]
+    body = json.dumps(items, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return FeedSnapshot(
+        body=body,
+        gzip_body=gzip.compress(body, compresslevel=6, mtime=0),
+        etag='"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"',
+        built_at=time.time(),
+    )
+
+
+class PublicFeed:
+    """Pre-encoded snapshot of the public feed, rebuilt off the request path.
+
+    Each worker holds its own snapshot. A change made on one worker bumps the
+    shared `feed_versions` row; the other workers poll it every `poll_interval`
+    seconds and rebuild when it moves.
+    """
+
+    def __init__(self) -> None:
+        self.limit = 200
+        self._snapshot : FeedSnapshot | None = None
+        self._version : int | None = None
+        self._generation = 0
+        self._changed = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._task : asyncio.Task | None = None
+
+    @property
+    def snapshot(self) -> FeedSnapshot | None:
+        return self._snapshot
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        if self._task is None:
+            self._snapshot = None
+        else:
+            # Keep serving the current snapshot until the refresher swaps in the new one.
+            self._changed.set()
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._snapshot = None
+        self._version = None
+        self._changed = asyncio.Event()
+        self._lock = asyncio.Lock()
+
+    async def load(self, db : AsyncSession) -> FeedSnapshot:
+        generation = self._generation
+        res = await db.execute(approved_feedback_stmt(self.limit))
+        snapshot = build_snapshot(res.scalars().all())
+        # An approval/delete that landed while we were querying makes this result stale.
+        if generation == self._generation:
+            self._snapshot = snapshot
+        return snapshot
+
+    async def get(self, db : AsyncSession) -> FeedSnapshot:
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+        async with self._lock:
+            if self._snapshot is not None:
+                return self._snapshot
+            return await self.load(db)
+
+    async def refresh(self, session_factory : async_sessionmaker[AsyncSession]) -> FeedSnapshot:
+        async with self._lock:
+            async with session_factory() as db:
+                # Read before the rows, so a change that lands in between is picked up on the next poll.
+                self._version = await get_feed_version(db, FEED_VERSION_NAME)
+                return await self.load(db)
+
+    async def _announce(self, session_factory : async_sessionmaker[AsyncSession]) -> None:
+        async with session_factory() as db:
+            await bump_feed_version(db, FEED_VERSION_NAME)
+            await db.commit()
+
+    async def _changed_elsewhere(self, session_factory : async_sessionmaker[AsyncSession]) -> bool:
+        async with session_factory() as db:
+            return await get_feed_version(db, FEED_VERSION_NAME) != self._version
+
+    async def _run(
+        self,
+        session_factory : async_sessionmaker[AsyncSession],
+        interval : float,
+        poll_interval : float,
+    ) -> None:
+        refreshed_at = time.monotonic()
+        while True:
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            changed_here = self._changed.is_set()
+            self._changed.clear()
+            if changed_here:
+                try:
+                    # Handlers invalidate after their commit, so the others see the new rows.
+                    await self._announce(session_factory)
+                except Exception:
+                    logger.exception('Failed to announce public feed change to other workers')
+            try:
+                due = changed_here or time.monotonic() - refreshed_at >= interval
+                if not due and not await self._changed_elsewhere(session_factory):
+                    continue
+                await self.refresh(session_factory)
+                refreshed_at = time.monotonic()
+            except Exception:
+                logger.exception('Public feed refresh failed')
+
+    def start(
+        self,
+        session_factory : async_sessionmaker[AsyncSession],
+        *,
+        limit : int,
+        interval : float,
+        poll_interval : float = 1.0,
+    ) -> None:
+        self.limit = limit
+        # Bind the event to the running loop; the app may be started more than once in-process.
+        self._changed = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._task = asyncio.create_task(self._run(session_factory, interval, poll_interval))
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+public_feed = PublicFeed()
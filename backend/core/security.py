@@ -1,33 +1,61 @@
-from passlib.context import CryptContext
-from jose import jwt, JWTError
+import hashlib
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any
 
 from core.config import get_settings
 
-settings = get_settings()
+# passlib/argon2 and jose are imported on first use to keep them off the
+# import path at boot; see `core.startup` for when they get preloaded.
+
+
+@lru_cache
+def get_pwd_context():
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=['argon2'], deprecated='auto')
 
-pwd_context = CryptContext(schemes=['argon2'], deprecated='auto')
 
 def hash_password(password : str):
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 def verify_password(password : str, hash_password : str):
-    return pwd_context.verify(password, hash_password)
+    return get_pwd_context().verify(password, hash_password)
 
 
-def create_access(subject : str, expire_minutes : int = settings.ACCESS_TOKEN_EXPIRE_MINUTES) -> str:
+def create_access(subject : str, expire_minutes : int | None = None) -> str:
+    from jose import jwt
+
+    settings = get_settings()
+    if expire_minutes is None:
+        expire_minutes = settings.ACCESS_TOKEN_EXPIRE_MINUTES
     now = datetime.now(timezone.utc)
     expire = now + timedelta(minutes=expire_minutes)
     payload : dict[str, Any] = {
-        'sub' : subject, 
+        'sub' : subject,
         'iat' : int(now.timestamp()),
         'exp' : int(expire.timestamp())
     }
     return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALG)
 
 def decode_token(token : str) -> dict[str, Any]:
+    from jose import jwt, JWTError
+
+    settings = get_settings()
     try:
         return jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALG])
     except JWTError as e:
-        raise ValueError('Invalid token') from e
\ No newline at end of file
+        raise ValueError('Invalid token') from e
+
+
+def hash_refresh_token(token : str) -> str:
+    # Refresh tokens are 256-bit random values, so a fast hash is enough; argon2
+    # only matters for low-entropy secrets like passwords.
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def preload() -> None:
+    """Import the hashing/JWT stacks and build the password context ahead of the first login."""
+    import jose.jwt  # noqa: F401
+
+    hash_password('warmup')
@@ -0,0 +1,91 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from core import security
+from core.health import readiness_probe
+from core.public_feed import public_feed
+from db.query_plans import HOT_QUERIES
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StartupState:
+    ready : bool = False
+    timings_ms : dict[str, float] = field(default_factory=dict)
+
+    def record(self, step : str, started : float) -> None:
+        self.timings_ms[step] = round((time.perf_counter() - started) * 1000, 1)
+
+
+startup_state = StartupState()
+
+
+async def _warm_connection(engine : AsyncEngine) -> None:
+    async with engine.connect() as conn:
+        await conn.execute(text('SELECT 1'))
+        # Executing each hot query once per pooled connection fills SQLAlchemy's
+        # compiled cache and, on asyncpg, the prepared statement cache.
+        for query in HOT_QUERIES:
+            await conn.execute(query.build())
+
+
+async def warmup(
+    engine : AsyncEngine,
+    session_factory : async_sessionmaker[AsyncSession],
+    *,
+    pool_connections : int,
+    budget_seconds : float,
+) -> None:
+    started = time.perf_counter()
+
+    step = time.perf_counter()
+    # Open the connections concurrently so they are all checked out at once and
+    # stay in the pool afterwards, instead of reusing a single one N times.
+    await asyncio.gather(*(_warm_connection(engine) for _ in range(max(pool_connections, 1))))
+    startup_state.record('warmup_pool', step)
+
+    step = time.perf_counter()
+    await public_feed.refresh(session_factory)
+    startup_state.record('warmup_public_feed', step)
+
+    step = time.perf_counter()
+    await asyncio.to_thread(security.preload)
+    startup_state.record('warmup_security', step)
+
+    startup_state.record('warmup_total', started)
+    startup_state.ready = True
+    readiness_probe.clear()
+
+    total = startup_state.timings_ms['warmup_total'] / 1000
+    log = logger.warning if total > budget_seconds else logger.info
+    log('Startup finished in %.3fs (budget %.1fs): %s', total, budget_seconds, startup_state.timings_ms)
+
+
+async def run_warmup(
+    engine : AsyncEngine,
+    session_factory : async_sessionmaker[AsyncSession],
+    *,
+    pool_connections : int,
+    budget_seconds : float,
+) -> None:
+    """Retry warmup until it succeeds; readiness stays false until then."""
+    delay = 0.5
+    while True:
+        try:
+            await warmup(
+                engine,
+                session_factory,
+                pool_connections=pool_connections,
+                budget_seconds=budget_seconds,
+            )
+            return
+        except Exception:
+            logger.exception('Startup warmup failed, retrying in %.1fs', delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 10)
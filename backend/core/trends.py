@@ -0,0 +1,188 @@
+import asyncio
+import logging
+import re
+import time
+from collections import Counter
+from collections.abc import Iterable
+from datetime import date, datetime, timezone
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from models.term_daily_count import TermDailyCount
+from schemas.trends import TrendReport
+
+logger = logging.getLogger(__name__)
+
+# Longer 'words' are URLs or keyboard mashing; this also keeps bigrams within the 80-char column.
+MAX_WORD_LENGTH = 39
+
+# Letters only (any script), with inner hyphens: "кое-что", "wi-fi".
+_WORD = re.compile(r'[^\W\d_]+(?:-[^\W\d_]+)*')
+
+
+def _normalize(word : str) -> str:
+    return word.lower().replace('ё', 'е')
+
+
+STOPWORDS = frozenset(_normalize(w) for w in '''
+и в во не что он на я с со как а то все она так его но да ты к у же вы за бы по только ее мне
+было вот от меня еще нет о из ему теперь когда даже ну вдруг ли если уже или ни быть был него
+до вас нибудь опять уж вам ведь там потом себя ничего ей может они тут где есть надо ней для мы тебя
+их чем была сам чтоб без будто чего раз тоже себе под будет ж тогда кто этот того потому этого какой
+совсем ним здесь этом один почти мой тем чтобы нее сейчас были куда зачем всех никогда можно при
+наконец два об другой хоть после над больше тот через эти нас про всего них какая много разве три эту
+моя впрочем свою этой перед иногда лучше чуть том нельзя такой им более всегда конечно всю между это
+очень просто вообще также весь вся
+the a an and or but of to in on at for with is was were are be been it this that we our you they i my
+very so not no
+'''.split())
+
+
+def extract_terms(text : str) -> set[str]:
+    """Unigrams and adjacent-word bigrams ("время ожидания"), stopwords removed.
+
+    A set, so a term counts once per feedback: counts mean "how many guests
+    mentioned it", not how often one guest repeated it.
+    """
+    terms : set[str] = set()
+    previous : str | None = None
+    for word in _WORD.findall(_normalize(text)):
+        if word in STOPWORDS or not 2 <= len(word) <= MAX_WORD_LENGTH:
+            previous = None
+            continue
+        terms.add(word)
+        if previous is not None:
+            terms.add(previous + ' ' + word)
+        previous = word
+    return terms
+
+
+def _day(created_at : datetime | None) -> date:
+    if created_at is None:
+        return datetime.now(timezone.utc).date()
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return created_at.astimezone(timezone.utc).date()
+
+
+def count_terms(rows : Iterable[tuple[str, datetime | None]]) -> Counter[tuple[date, str]]:
+    counts : Counter[tuple[date, str]] = Counter()
+    for text, created_at in rows:
+        day = _day(created_at)
+        counts.update((day, term) for term in extract_terms(text))
+    return counts
+
+
+async def upsert_term_counts(db : AsyncSession, counts : Counter[tuple[date, str]]) -> None:
+    """Add `counts` to the stored daily counters (caller commits)."""
+    if not counts:
+        return
+    conn = await db.connection()
+    dialect_insert = postgresql.insert if conn.dialect.name == 'postgresql' else sqlite.insert
+    stmt = dialect_insert(TermDailyCount.__table__)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['day', 'term'],
+        set_={'count': TermDailyCount.__table__.c.count + stmt.excluded.count},
+    )
+    rows = [{'day': day, 'term': term, 'count': n} for (day, term), n in counts.items()]
+    await db.execute(stmt, rows)
+
+
+class TrendCounter:
+    """Accumulates term counts of new feedback in memory and adds them to the table periodically.
+
+    Handlers only update a Counter; the upsert runs in the background every
+    `flush_interval` seconds and once more on shutdown. Counts lost in a crash
+    can be rebuilt with `python -m scripts.backfill_trends`.
+    """
+
+    def __init__(self, flush_interval : float = 10.0) -> None:
+        self.enabled = True
+        self.flush_interval = flush_interval
+        self.session_factory : async_sessionmaker[AsyncSession] | None = None
+        self._pending : Counter[tuple[date, str]] = Counter()
+        self._task : asyncio.Task | None = None
+        self._reports : dict[tuple, tuple[float, TrendReport]] = {}
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def configure(
+        self,
+        *,
+        enabled : bool,
+        session_factory : async_sessionmaker[AsyncSession],
+        flush_interval : float,
+    ) -> None:
+        self.enabled = enabled
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval
+
+    def add(self, text : str, created_at : datetime | None = None) -> None:
+        if self.enabled:
+            self._pending.update(count_terms(((text, created_at),)))
+
+    def merge(self, counts : Counter[tuple[date, str]]) -> None:
+        if self.enabled:
+            self._pending.update(counts)
+
+    def cached_report(self, key : tuple) -> TrendReport | None:
+        # Counters only change once per flush interval, so neither does the report.
+        entry = self._reports.get(key)
+        if entry is None or time.monotonic() - entry[0] >= self.flush_interval:
+            return None
+        return entry[1]
+
+    def store_report(self, key : tuple, report : TrendReport) -> None:
+        if len(self._reports) >= 64:
+            self._reports.clear()
+        self._reports[key] = (time.monotonic(), report)
+
+    async def flush(self) -> int:
+        if self.session_factory is None or not self._pending:
+            return 0
+        counts, self._pending = self._pending, Counter()
+        try:
+            async with self.session_factory() as db:
+                await upsert_term_counts(db, counts)
+                await db.commit()
+        except BaseException:
+            # Put them back so the next flush retries them.
+            self._pending.update(counts)
+            raise
+        self._reports.clear()
+        return len(counts)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception('Failed to write term counters, will retry')
+
+    def start(self) -> None:
+        if self._task is None and self.enabled:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.flush()
+        except Exception:
+            logger.error('Shutting down with %d unwritten term counters', len(self._pending))
+
+    def clear(self) -> None:
+        self._pending.clear()
+        self._reports.clear()
+
+
+trend_counter = TrendCounter()
@@ -0,0 +1,35 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.audit_log import AuditLog
+
+
+def audit_page_stmt(
+    limit : int,
+    before_id : int | None = None,
+    action : str | None = None,
+    actor_id : int | None = None,
+):
+    stmt = select(AuditLog)
+    if before_id is not None:
+        stmt = stmt.where(AuditLog.id < before_id)
+    if action is not None:
+        stmt = stmt.where(AuditLog.action == action)
+    if actor_id is not None:
+        stmt = stmt.where(AuditLog.actor_id == actor_id)
+    return stmt.order_by(AuditLog.id.desc()).limit(limit)
+
+
+async def list_audit_entries(
+    db : AsyncSession,
+    *,
+    limit : int,
+    before_id : int | None = None,
+    action : str | None = None,
+    actor_id : int | None = None,
+) -> tuple[list[AuditLog], int | None]:
+    # One extra row tells whether there is another page without a COUNT.
+    res = await db.execute(audit_page_stmt(limit + 1, before_id, action, actor_id))
+    entries = list(res.scalars().all())
+    next_before_id = entries[limit - 1].id if len(entries) > limit else None
+    return entries[:limit], next_before_id
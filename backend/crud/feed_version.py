@@ -0,0 +1,22 @@
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.feed_version import FeedVersion
+
+
+async def get_feed_version(db : AsyncSession, name : str) -> int:
+    res = await db.execute(select(FeedVersion.version).where(FeedVersion.name == name))
+    return res.scalar_one_or_none() or 0
+
+
+async def bump_feed_version(db : AsyncSession, name : str) -> None:
+    """Increment the counter, creating the row on first use (caller commits)."""
+    conn = await db.connection()
+    dialect_insert = postgresql.insert if conn.dialect.name == 'postgresql' else sqlite.insert
+    stmt = dialect_insert(FeedVersion.__table__).values(name=name, version=1)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['name'],
+        set_={'version': FeedVersion.__table__.c.version + 1},
+    )
+    await db.execute(stmt)
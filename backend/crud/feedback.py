@@ -32,11 +32,22 @@ async def delete_feedback(feedback : FeedBack, db : AsyncSession):
     await db.delete(feedback)
     await db.commit()
 
-async def get_feedback_list(db: AsyncSession, approved_only : bool = True):
+def approved_feedback_stmt(limit : int):
+    return (
+        select(FeedBack)
+        .where(FeedBack.is_approved.is_(True))
+        .order_by(FeedBack.created_at.desc())
+        .limit(limit)
+    )
+
+def feedback_list_stmt(approved_only : bool = True):
     stmt = select(FeedBack)
     if approved_only:
         stmt = stmt.where(FeedBack.is_approved.is_(True))
-    res = await db.execute(stmt.order_by(FeedBack.created_at.desc()))
+    return stmt.order_by(FeedBack.created_at.desc())
+
+async def get_feedback_list(db: AsyncSession, approved_only : bool = True):
+    res = await db.execute(feedback_list_stmt(approved_only))
     return res.scalars().all()
 
 async def set_feedback_approved(feedback : FeedBack, is_approved : bool, db : AsyncSession):
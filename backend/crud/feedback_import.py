@@ -0,0 +1,146 @@
+import asyncio
+import csv
+import json
+import time
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Literal, TextIO
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.trends import count_terms, trend_counter
+from models.feedback import FeedBack
+from schemas.feedback import FeedbackImportError, FeedbackImportReport, FeedbackImportRow
+
+ImportFormat = Literal['csv', 'ndjson']
+
+COPY_COLUMNS = ('type', 'rating', 'text', 'name', 'contact', 'is_approved', 'created_at', 'source')
+MAX_REPORTED_ERRORS = 100
+
+
+def detect_format(filename : str | None) -> ImportFormat | None:
+    if not filename:
+        return None
+    lowered = filename.lower()
+    if lowered.endswith('.csv'):
+        return 'csv'
+    if lowered.endswith(('.ndjson', '.jsonl')):
+        return 'ndjson'
+    return None
+
+
+def iter_raw_rows(stream : TextIO, fmt : ImportFormat) -> Iterator[tuple[int, dict | str]]:
+    """Yield `(row_number, fields)` or `(row_number, error_message)` for every input row."""
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for row in reader:
+            # Empty optional cells mean "use the default", not an empty string.
+            yield reader.line_num, {k: v for k, v in row.items() if k is not None and v not in ('', None)}
+        return
+
+    for number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield number, f'Invalid JSON: {e.msg}'
+            continue
+        if not isinstance(row, dict):
+            yield number, 'Expected a JSON object'
+            continue
+        yield number, row
+
+
+def _validate_chunk(
+    raw_rows : list[tuple[int, dict | str]],
+    default_source : str | None,
+    now : datetime,
+) -> tuple[list[dict], list[int], list[FeedbackImportError]]:
+    rows : list[dict] = []
+    numbers : list[int] = []
+    errors : list[FeedbackImportError] = []
+    for number, raw in raw_rows:
+        if isinstance(raw, str):
+            errors.append(FeedbackImportError(row=number, error=raw))
+            continue
+        try:
+            item = FeedbackImportRow.model_validate(raw)
+        except ValidationError as e:
+            first = e.errors()[0]
+            location = '.'.join(str(part) for part in first['loc'])
+            errors.append(FeedbackImportError(row=number, error=f'{location}: {first["msg"]}'))
+            continue
+        row = item.model_dump()
+        row['created_at'] = row['created_at'] or now
+        row['source'] = row['source'] or default_source
+        rows.append(row)
+        numbers.append(number)
+    return rows, numbers, errors
+
+
+def _take_chunk(rows : Iterator, size : int) -> list:
+    return list(islice(rows, size))
+
+
+async def insert_feedback_rows(db : AsyncSession, rows : list[dict]) -> None:
+    """Load rows with COPY on Postgres and a single executemany elsewhere."""
+    conn = await db.connection()
+    if conn.dialect.name == 'postgresql':
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            FeedBack.__tablename__,
+            records=[tuple(row[column] for column in COPY_COLUMNS) for row in rows],
+            columns=COPY_COLUMNS,
+        )
+    else:
+        await conn.execute(insert(FeedBack.__table__), rows)
+
+
+async def import_feedback(
+    db : AsyncSession,
+    stream : TextIO,
+    fmt : ImportFormat,
+    *,
+    source : str | None = None,
+    chunk_size : int = 1000,
+) -> FeedbackImportReport:
+    started = time.perf_counter()
+    raw_rows = iter_raw_rows(stream, fmt)
+    inserted = 0
+    failed = 0
+    errors : list[FeedbackImportError] = []
+
+    while True:
+        # Parsing and validation are CPU work on a (possibly spooled) file; keep them off the loop.
+        chunk = await asyncio.to_thread(_take_chunk, raw_rows, chunk_size)
+        if not chunk:
+            break
+        rows, numbers, chunk_errors = await asyncio.to_thread(_validate_chunk, chunk, source, datetime.now(timezone.utc))
+        if rows:
+            try:
+                await insert_feedback_rows(db, rows)
+                await db.commit()
+            except Exception as e:
+                await db.rollback()
+                message = f'Chunk rejected by database: {type(e).__name__}'
+                chunk_errors.extend(FeedbackImportError(row=number, error=message) for number in numbers)
+                rows = []
+        if rows and trend_counter.enabled:
+            counts = await asyncio.to_thread(count_terms, [(row['text'], row['created_at']) for row in rows])
+            trend_counter.merge(counts)
+        inserted += len(rows)
+        failed += len(chunk_errors)
+        errors.extend(chunk_errors[:MAX_REPORTED_ERRORS - len(errors)])
+
+    elapsed = time.perf_counter() - started
+    return FeedbackImportReport(
+        inserted=inserted,
+        failed=failed,
+        errors=errors,
+        elapsed_seconds=round(elapsed, 3),
+        rows_per_second=round(inserted / elapsed, 1) if elapsed > 0 else float(inserted),
+    )
@@ -0,0 +1,65 @@
+import secrets
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import get_settings
+from core.security import hash_refresh_token
+from models.refresh_token import RefreshToken
+from models.user import User
+
+
+def _as_utc(value : datetime) -> datetime:
+    # SQLite hands back naive datetimes even for timezone-aware columns.
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+async def issue_refresh_token(user_id : int, db : AsyncSession, family_id : str | None = None) -> str:
+    token = secrets.token_urlsafe(32)
+    now = datetime.now(timezone.utc)
+    db.add(RefreshToken(
+        user_id=user_id,
+        family_id=family_id or secrets.token_hex(16),
+        token_hash=hash_refresh_token(token),
+        created_at=now,
+        expires_at=now + timedelta(days=get_settings().REFRESH_TOKEN_EXPIRE_DAYS),
+    ))
+    await db.commit()
+    return token
+
+
+async def get_refresh_token(token : str, db : AsyncSession) -> RefreshToken | None:
+    # Joining users means tokens of deleted admins never resolve.
+    res = await db.execute(
+        select(RefreshToken)
+        .join(User, User.id == RefreshToken.user_id)
+        .where(RefreshToken.token_hash == hash_refresh_token(token))
+    )
+    return res.scalar_one_or_none()
+
+
+async def revoke_refresh_token(refresh_token : RefreshToken, db : AsyncSession) -> bool:
+    """Mark the token used without committing; the replacement is committed with it.
+
+    Returns False if another request already used it.
+    """
+    res = await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.id == refresh_token.id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=datetime.now(timezone.utc))
+    )
+    return res.rowcount == 1
+
+
+async def revoke_token_family(family_id : str, db : AsyncSession) -> None:
+    await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=datetime.now(timezone.utc))
+    )
+    await db.commit()
+
+
+def is_expired(refresh_token : RefreshToken) -> bool:
+    return _as_utc(refresh_token.expires_at) <= datetime.now(timezone.utc)
@@ -0,0 +1,49 @@
+from datetime import date, timedelta
+
+from sqlalchemy import case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.term_daily_count import TermDailyCount
+from schemas.trends import TrendReport, TrendTerm
+
+
+def trend_period_stmt(period_start : date, baseline_start : date, period_end : date, min_count : int):
+    current = func.sum(case((TermDailyCount.day >= period_start, TermDailyCount.count), else_=0))
+    baseline = func.sum(case((TermDailyCount.day < period_start, TermDailyCount.count), else_=0))
+    return (
+        select(TermDailyCount.term, current.label('current'), baseline.label('baseline'))
+        .where(TermDailyCount.day >= baseline_start, TermDailyCount.day <= period_end)
+        .group_by(TermDailyCount.term)
+        # Drops the long tail of one-off words before it leaves the database.
+        .having(current >= min_count)
+    )
+
+
+async def get_trend_report(
+    db : AsyncSession,
+    *,
+    today : date,
+    days : int,
+    baseline_days : int,
+    limit : int,
+    min_count : int,
+) -> TrendReport:
+    period_start = today - timedelta(days=days - 1)
+    baseline_start = period_start - timedelta(days=baseline_days)
+    res = await db.execute(trend_period_stmt(period_start, baseline_start, today, min_count))
+
+    terms = []
+    for term, current, baseline in res.all():
+        # One extra mention per window keeps brand-new terms from dividing by zero.
+        change = ((current + 1) / days) / ((baseline + 1) / baseline_days)
+        terms.append(TrendTerm(term=term, count=current, baseline_count=baseline, change=round(change, 2)))
+
+    top = sorted(terms, key=lambda t: (-t.count, t.term))[:limit]
+    rising = sorted((t for t in terms if t.change > 1), key=lambda t: (-t.change, -t.count, t.term))[:limit]
+    return TrendReport(
+        period_start=period_start,
+        period_end=today,
+        baseline_start=baseline_start,
+        top=top,
+        rising=rising,
+    )
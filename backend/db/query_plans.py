@@ -0,0 +1,149 @@
+import json
+import re
+from datetime import date
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from sqlalchemy import select
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import Executable, Select
+
+from crud.audit import audit_page_stmt
+from crud.feedback import approved_feedback_stmt, feedback_list_stmt
+from crud.trends import trend_period_stmt
+from models.feedback import FeedBack
+from models.idempotency_key import IdempotencyKey
+from models.moderation_settings import ModerationSettings
+from models.refresh_token import RefreshToken
+from models.user import User
+
+
+@dataclass(frozen=True)
+class HotQuery:
+    name : str
+    build : Callable[[], Executable]
+    # Single-row configuration tables, and lists that return every row anyway.
+    allow_seq_scan : bool = False
+    # Aggregations over an index range sort their (bounded) groups.
+    allow_sort : bool = False
+
+
+HOT_QUERIES : list[HotQuery] = [
+    HotQuery('feedback.public_feed', lambda: approved_feedback_stmt(200)),
+    # The admin list returns every row, so it reads the whole table; it must
+    # still come out of the created_at index rather than a full sort.
+    HotQuery('feedback.admin_list', lambda: feedback_list_stmt(approved_only=False), allow_seq_scan=True),
+    HotQuery('feedback.by_id', lambda: select(FeedBack).where(FeedBack.id == 1)),
+    HotQuery('user.by_id', lambda: select(User).where(User.id == 1)),
+    HotQuery('user.by_email', lambda: select(User).where(User.email == 'admin@example.com')),
+    HotQuery(
+        'refresh_token.by_hash',
+        lambda: select(RefreshToken).join(User, User.id == RefreshToken.user_id).where(RefreshToken.token_hash == '0' * 64),
+    ),
+    HotQuery('idempotency.by_key', lambda: select(IdempotencyKey).where(IdempotencyKey.key == '0' * 64)),
+    HotQuery('audit.first_page', lambda: audit_page_stmt(51)),
+    HotQuery('audit.page', lambda: audit_page_stmt(51, before_id=1000)),
+    HotQuery('audit.first_page_by_action', lambda: audit_page_stmt(51, action='feedback.approve')),
+    HotQuery('audit.page_by_action', lambda: audit_page_stmt(51, before_id=1000, action='feedback.approve')),
+    HotQuery('audit.first_page_by_actor', lambda: audit_page_stmt(51, actor_id=1)),
+    HotQuery('audit.page_by_actor', lambda: audit_page_stmt(51, before_id=1000, actor_id=1)),
+    HotQuery(
+        'trends.period',
+        lambda: trend_period_stmt(date(2026, 1, 29), date(2026, 1, 1), date(2026, 2, 4), 3),
+        allow_sort=True,
+    ),
+    HotQuery(
+        'moderation.settings',
+        lambda: select(ModerationSettings).order_by(ModerationSettings.id.asc()).limit(1),
+        allow_seq_scan=True,
+    ),
+]
+
+
+def register_hot_query(query : HotQuery) -> HotQuery:
+    HOT_QUERIES.append(query)
+    return query
+
+
+@dataclass
+class PlanReport:
+    name : str
+    plan : list[str]
+    violations : list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.violations
+
+
+# SEARCH lines use an index lookup; a SCAN line reads the whole table or a whole
+# index ("SCAN users USING COVERING INDEX ..."), which grows just the same.
+_SQLITE_FULL_SCAN = re.compile(r'^SCAN (?:TABLE )?(\w+)(?: (USING .+))?')
+
+
+def _is_top_n(stmt : Executable) -> bool:
+    return isinstance(stmt, Select) and stmt._limit_clause is not None and bool(stmt._order_by_clauses)
+
+
+def _sqlite_plan(conn : Connection, sql : str, top_n : bool) -> tuple[list[str], list[str]]:
+    rows = conn.exec_driver_sql(f'EXPLAIN QUERY PLAN {sql}').all()
+    plan = [row[-1] for row in rows]
+    # `ORDER BY ... LIMIT n` walked in index (or rowid) order stops after n rows,
+    # provided the outer loop is that scan and nothing is sorted.
+    bounded = top_n and not any(line.startswith('USE TEMP B-TREE') for line in plan)
+    violations = []
+    for i, line in enumerate(plan):
+        match = _SQLITE_FULL_SCAN.match(line)
+        if match and not (bounded and i == 0):
+            table, using = match.groups()
+            violations.append(f'sequential scan on {table}' + (f' ({using})' if using else ''))
+        if line.startswith('USE TEMP B-TREE'):
+            violations.append(f'full sort: {line}')
+    return plan, violations
+
+
+def _walk_pg_nodes(node : dict, limited : bool = False):
+    yield node, limited
+    limited = limited or node['Node Type'] == 'Limit'
+    for child in node.get('Plans', ()):
+        yield from _walk_pg_nodes(child, limited)
+
+
+def _postgres_plan(conn : Connection, sql : str) -> tuple[list[str], list[str]]:
+    # With sequential scans priced out the planner picks an index whenever one
+    # can serve the query, so a remaining Seq Scan means the index is missing.
+    conn.exec_driver_sql('SET LOCAL enable_seqscan = off')
+    raw = conn.exec_driver_sql(f'EXPLAIN (FORMAT JSON) {sql}').scalar_one()
+    document = json.loads(raw) if isinstance(raw, str) else raw
+    plan, violations = [], []
+    for node, limited in _walk_pg_nodes(document[0]['Plan']):
+        relation = node.get('Relation Name')
+        plan.append(node['Node Type'] + (f' on {relation}' if relation else '') + (f" using {node['Index Name']}" if 'Index Name' in node else ''))
+        if node['Node Type'] == 'Seq Scan':
+            violations.append(f'sequential scan on {relation}')
+        # Same rule as SQLite: an index walked end to end without a condition is a
+        # full scan, unless a LIMIT above it stops it early.
+        if node['Node Type'] in ('Index Scan', 'Index Only Scan') and 'Index Cond' not in node and not limited:
+            violations.append(f"sequential scan on {relation} (USING INDEX {node['Index Name']})")
+        if node['Node Type'] == 'Sort':
+            violations.append(f"full sort on {', '.join(node.get('Sort Key', []))}")
+    return plan, violations
+
+
+def explain_hot_query(conn : Connection, query : HotQuery) -> PlanReport:
+    """Capture the plan for one registered query (sync connection; use `run_sync` from async code)."""
+    stmt = query.build()
+    sql = str(stmt.compile(dialect=conn.dialect, compile_kwargs={'literal_binds': True}))
+    if conn.dialect.name == 'postgresql':
+        plan, violations = _postgres_plan(conn, sql)
+    else:
+        plan, violations = _sqlite_plan(conn, sql, _is_top_n(stmt))
+    if query.allow_seq_scan:
+        violations = [v for v in violations if not v.startswith('sequential scan')]
+    if query.allow_sort:
+        violations = [v for v in violations if not v.startswith('full sort')]
+    return PlanReport(name=query.name, plan=plan, violations=violations)
+
+
+def check_hot_queries(conn : Connection) -> list[PlanReport]:
+    return [explain_hot_query(conn, query) for query in HOT_QUERIES]
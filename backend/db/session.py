@@ -1,26 +1,72 @@
 from collections.abc import AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from core.config import get_settings
 
-settings = get_settings()
-database_url = settings.DATABASE_URL
-if database_url.startswith("postgres://"):
-    database_url = database_url.replace("postgres://", "postgresql+asyncpg://", 1)
-elif database_url.startswith("postgresql://") and "+asyncpg" not in database_url:
-    database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
-
-engine = create_async_engine(
-    database_url, 
-    echo=False, 
-    future=True
-)
-
-AsyncSessionLocal = async_sessionmaker(
-    bind=engine, 
-    class_=AsyncSession, 
-    expire_on_commit=False,
-)
+_engine : AsyncEngine | None = None
+_sessionmaker : async_sessionmaker[AsyncSession] | None = None
+
+
+def get_database_url() -> str:
+    database_url = get_settings().DATABASE_URL
+    if database_url.startswith("postgres://"):
+        database_url = database_url.replace("postgres://", "postgresql+asyncpg://", 1)
+    elif database_url.startswith("postgresql://") and "+asyncpg" not in database_url:
+        database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return database_url
+
+
+def init_engine() -> AsyncEngine:
+    """Create the engine and pool for this process.
+
+    Called from the app lifespan so every worker builds its own pool after fork.
+    """
+    global _engine, _sessionmaker
+    if _engine is not None:
+        return _engine
+
+    settings = get_settings()
+    database_url = get_database_url()
+    pool_options = {}
+    if database_url.startswith("postgresql"):
+        pool_options = {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_pre_ping": True,
+        }
+
+    _engine = create_async_engine(
+        database_url,
+        echo=False,
+        future=True,
+        **pool_options,
+    )
+    _sessionmaker = async_sessionmaker(
+        bind=_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    return _engine
+
+
+def get_engine() -> AsyncEngine:
+    return _engine if _engine is not None else init_engine()
+
+
+def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    if _sessionmaker is None:
+        init_engine()
+    return _sessionmaker
+
+
+async def dispose_engine() -> None:
+    global _engine, _sessionmaker
+    if _engine is None:
+        return
+    await _engine.dispose()
+    _engine = None
+    _sessionmaker = None
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with AsyncSessionLocal() as session:
-        yield session   
+    async with get_sessionmaker()() as session:
+        yield session
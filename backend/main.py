@@ -1,13 +1,111 @@
+import time
+
+_import_started = time.perf_counter()
+
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
+from api.health import router as health_router
 from api.router import router as v1_router
+from core.audit import DatabaseAuditSink, FileAuditSink, audit_trail
 from core.config import get_settings
+from core.health import loop_lag_monitor, readiness_probe
+from core.idempotency import IdempotencyMiddleware, idempotency_store
+from core.load_shedding import LoadSheddingMiddleware, load_shedder
+from core.public_feed import public_feed
+from core.startup import run_warmup, startup_state
+from core.trends import trend_counter
+from db.session import dispose_engine, get_sessionmaker, init_engine
 
-app = FastAPI()
+startup_state.record('import', _import_started)
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app : FastAPI):
+    # Runs once per worker process, after fork, so each worker owns its pool.
+    settings = get_settings()
+    step = time.perf_counter()
+    engine = init_engine()
+    session_factory = get_sessionmaker()
+    startup_state.record('engine', step)
+
+    idempotency_store.configure(
+        ttl=settings.IDEMPOTENCY_TTL_SECONDS,
+        max_entries=settings.IDEMPOTENCY_MAX_ENTRIES,
+        session_factory=session_factory if settings.idempotency_db_enabled() else None,
+        lock_seconds=settings.IDEMPOTENCY_LOCK_SECONDS,
+    )
+    loop_lag_monitor.configure(
+        interval=settings.HEALTH_LOOP_LAG_INTERVAL_MS / 1000,
+        window=settings.HEALTH_LOOP_LAG_WINDOW_SECONDS,
+    )
+    loop_lag_monitor.start()
+    load_shedder.configure(
+        enabled=settings.LOAD_SHED_ENABLED,
+        initial_limit=settings.LOAD_SHED_INITIAL_LIMIT,
+        min_limit=settings.LOAD_SHED_MIN_LIMIT,
+        max_limit=settings.LOAD_SHED_MAX_LIMIT,
+        latency_target=settings.LOAD_SHED_LATENCY_TARGET_MS / 1000,
+        retry_after=settings.LOAD_SHED_RETRY_AFTER_SECONDS,
+    )
+    if settings.AUDIT_SINK == 'db':
+        audit_sink = DatabaseAuditSink(session_factory)
+    elif settings.AUDIT_SINK == 'file':
+        audit_sink = FileAuditSink(
+            settings.AUDIT_FILE_PATH,
+            max_bytes=settings.AUDIT_FILE_MAX_BYTES,
+            backup_count=settings.AUDIT_FILE_BACKUP_COUNT,
+        )
+    else:
+        audit_sink = None
+    audit_trail.configure(
+        sink=audit_sink,
+        max_buffer=settings.AUDIT_BUFFER_SIZE,
+        batch_size=settings.AUDIT_BATCH_SIZE,
+        flush_interval=settings.AUDIT_FLUSH_SECONDS,
+    )
+    audit_trail.start()
+    trend_counter.configure(
+        enabled=settings.TRENDS_ENABLED,
+        session_factory=session_factory,
+        flush_interval=settings.TRENDS_FLUSH_SECONDS,
+    )
+    trend_counter.start()
+    public_feed.start(
+        session_factory,
+        limit=settings.PUBLIC_FEED_LIMIT,
+        interval=settings.PUBLIC_FEED_REFRESH_SECONDS,
+        poll_interval=settings.PUBLIC_FEED_VERSION_POLL_SECONDS,
+    )
+    # Warm up in the background: the server starts accepting connections right
+    # away and `/readyz` reports ready once the pool and caches are hot.
+    warmup_task = asyncio.create_task(run_warmup(
+        engine,
+        session_factory,
+        pool_connections=settings.WARMUP_POOL_CONNECTIONS,
+        budget_seconds=settings.STARTUP_BUDGET_SECONDS,
+    ))
+    try:
+        yield
+    finally:
+        startup_state.ready = False
+        readiness_probe.clear()
+        warmup_task.cancel()
+        await public_feed.stop()
+        # Before the engine goes away: the final flush still needs the pool.
+        await audit_trail.stop()
+        await trend_counter.stop()
+        await loop_lag_monitor.stop()
+        await dispose_engine()
+
+
+app = FastAPI(lifespan=lifespan)
+
 default_origins = [
     "http://127.0.0.1:5173",
     "http://localhost:5173",
@@ -16,6 +114,10 @@ configured_origins = []
 if settings.CORS_ORIGINS:
     configured_origins = [origin.strip() for origin in settings.CORS_ORIGINS.split(",") if origin.strip()]
 
+app.add_middleware(IdempotencyMiddleware, store=idempotency_store)
+# Shedding wraps idempotency so rejected requests never take a key lock; CORS stays
+# outermost so browsers can read the 503.
+app.add_middleware(LoadSheddingMiddleware, shedder=load_shedder)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=configured_origins or default_origins,
@@ -24,6 +126,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.include_router(health_router)
 app.include_router(v1_router)
 
 
@@ -5,11 +5,13 @@ from sqlalchemy import pool
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
-from core.config import get_settings
+from db.session import get_database_url
 from db.base import Base
 import models.user  # noqa: F401
 import models.feedback  # noqa: F401
 import models.moderation_settings  # noqa: F401
+import models.idempotency_key  # noqa: F401
+import models.refresh_token  # noqa: F401
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -20,12 +22,7 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-settings = get_settings()
-database_url = settings.DATABASE_URL
-if database_url.startswith("postgres://"):
-    database_url = database_url.replace("postgres://", "postgresql+asyncpg://", 1)
-elif database_url.startswith("postgresql://") and "+asyncpg" not in database_url:
-    database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+database_url = get_database_url()
 config.set_main_option("sqlalchemy.url", database_url)
 
 target_metadata = Base.metadata
@@ -0,0 +1,41 @@
+"""add audit log
+
+Revision ID: 9b1f6c3a8e24
+Revises: e4b7d2c19f58
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9b1f6c3a8e24"
+down_revision: Union[str, Sequence[str], None] = "e4b7d2c19f58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "audit_log",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("actor_id", sa.Integer(), nullable=True),
+        sa.Column("actor_email", sa.String(length=255), nullable=True),
+        sa.Column("action", sa.String(length=50), nullable=False),
+        sa.Column("target_type", sa.String(length=50), nullable=True),
+        sa.Column("target_id", sa.Integer(), nullable=True),
+        sa.Column("details", sa.Text(), server_default="{}", nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_audit_log_action_id", "audit_log", ["action", "id"], unique=False)
+    op.create_index("ix_audit_log_actor_id_id", "audit_log", ["actor_id", "id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_log_actor_id_id", table_name="audit_log")
+    op.drop_index("ix_audit_log_action_id", table_name="audit_log")
+    op.drop_table("audit_log")
@@ -0,0 +1,33 @@
+"""add term daily counts
+
+Revision ID: d2a8e5f17b63
+Revises: 9b1f6c3a8e24
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d2a8e5f17b63"
+down_revision: Union[str, Sequence[str], None] = "9b1f6c3a8e24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "term_daily_counts",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("term", sa.String(length=80), nullable=False),
+        sa.Column("count", sa.Integer(), server_default="0", nullable=False),
+        sa.PrimaryKeyConstraint("day", "term"),
+        sqlite_with_rowid=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("term_daily_counts")
@@ -0,0 +1,33 @@
+"""add feedback (is_approved, created_at) index
+
+Revision ID: e4b7d2c19f58
+Revises: c58f2e7a9d31
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e4b7d2c19f58"
+down_revision: Union[str, Sequence[str], None] = "c58f2e7a9d31"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_feedbacks_is_approved_created_at",
+        "feedbacks",
+        ["is_approved", "created_at"],
+        unique=False,
+    )
+    # The composite index has is_approved as its prefix, so the single-column one is redundant.
+    op.drop_index(op.f("ix_feedbacks_is_approved"), table_name="feedbacks")
+
+
+def downgrade() -> None:
+    op.create_index(op.f("ix_feedbacks_is_approved"), "feedbacks", ["is_approved"], unique=False)
+    op.drop_index("ix_feedbacks_is_approved_created_at", table_name="feedbacks")
@@ -0,0 +1,25 @@
+"""add feedback created_at index
+
+Revision ID: f6a1c9d3b245
+Revises: d2a8e5f17b63
+Create Date: 2026-10-20 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f6a1c9d3b245"
+down_revision: Union[str, Sequence[str], None] = "d2a8e5f17b63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f("ix_feedbacks_created_at"), "feedbacks", ["created_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_feedbacks_created_at"), table_name="feedbacks")
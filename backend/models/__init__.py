@@ -2,3 +2,8 @@
 from models.user import User
 from models.feedback import FeedBack
 from models.moderation_settings import ModerationSettings
+from models.idempotency_key import IdempotencyKey
+from models.refresh_token import RefreshToken
+from models.audit_log import AuditLog
+from models.term_daily_count import TermDailyCount
+from models.feed_version import FeedVersion
@@ -0,0 +1,26 @@
+from sqlalchemy import DateTime, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from datetime import datetime
+from db.base import Base
+
+
+class AuditLog(Base):
+    """Append-only record of moderation and admin actions; rows are never updated or deleted by the app."""
+    __tablename__ = 'audit_log'
+    __table_args__ = (
+        # Keyset pagination (`id < cursor ORDER BY id DESC`) filtered by action or actor.
+        Index('ix_audit_log_action_id', 'action', 'id'),
+        Index('ix_audit_log_actor_id_id', 'actor_id', 'id'),
+    )
+
+    id : Mapped[int] = mapped_column(primary_key=True)
+    # Event time, set when the handler records it rather than when the batch is written.
+    created_at : Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    # No foreign key: entries must outlive the admin account that made them.
+    actor_id : Mapped[int | None] = mapped_column(Integer, nullable=True)
+    actor_email : Mapped[str | None] = mapped_column(String(255), nullable=True)
+    action : Mapped[str] = mapped_column(String(50), nullable=False)
+    target_type : Mapped[str | None] = mapped_column(String(50), nullable=True)
+    target_id : Mapped[int | None] = mapped_column(Integer, nullable=True)
+    details : Mapped[str] = mapped_column(Text, nullable=False, server_default='{}')
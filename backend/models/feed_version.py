@@ -0,0 +1,16 @@
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.base import Base
+
+
+class FeedVersion(Base):
+    """Change counter for a cached feed, bumped by whichever worker changed it.
+
+    Every worker keeps its own snapshot; the others poll this row and rebuild
+    theirs when the number moves.
+    """
+    __tablename__ = 'feed_versions'
+
+    name : Mapped[str] = mapped_column(String(50), primary_key=True)
+    version : Mapped[int] = mapped_column(Integer, nullable=False, server_default='0')
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Enum, String, CheckConstraint, Text, DateTime, func
+from sqlalchemy import Boolean, Enum, String, CheckConstraint, Index, Text, DateTime, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from datetime import datetime
@@ -10,6 +10,8 @@ class FeedBack(Base):
     __table_args__ = (
         CheckConstraint("type IN ('review','suggestion')", name="feedback_type_check"),
         CheckConstraint("rating BETWEEN 1 AND 10", name="rating_range_check"),
+        # Serves the public feed: filter on is_approved, newest first, without a sort.
+        Index("ix_feedbacks_is_approved_created_at", "is_approved", "created_at"),
     )
 
     id : Mapped[int] = mapped_column(primary_key=True)
@@ -21,7 +23,8 @@ class FeedBack(Base):
     text : Mapped[str] = mapped_column(Text, nullable=False)
     name : Mapped[str] = mapped_column(String(250), nullable=False, index=True)
     contact : Mapped[str] = mapped_column(String(50), nullable=False)
-    is_approved : Mapped[bool] = mapped_column(Boolean, nullable=False, server_default='0', index=True)
+    is_approved : Mapped[bool] = mapped_column(Boolean, nullable=False, server_default='0')
     
-    created_at : Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    # Serves the admin list (every row, newest first) without a sort.
+    created_at : Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), index=True)
     source : Mapped[str | None] = mapped_column(String(150), nullable=True)
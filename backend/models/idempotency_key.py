@@ -0,0 +1,16 @@
+from sqlalchemy import DateTime, LargeBinary, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from datetime import datetime
+from db.base import Base
+
+
+class IdempotencyKey(Base):
+    __tablename__ = 'idempotency_keys'
+
+    key : Mapped[str] = mapped_column(String(64), primary_key=True)
+    fingerprint : Mapped[str] = mapped_column(String(64), nullable=False)
+    status_code : Mapped[int] = mapped_column(nullable=False)
+    headers : Mapped[str] = mapped_column(Text, nullable=False)
+    body : Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    expires_at : Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
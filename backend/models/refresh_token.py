@@ -0,0 +1,18 @@
+from sqlalchemy import DateTime, ForeignKey, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from datetime import datetime
+from db.base import Base
+
+
+class RefreshToken(Base):
+    __tablename__ = 'refresh_tokens'
+
+    id : Mapped[int] = mapped_column(primary_key=True)
+    user_id : Mapped[int] = mapped_column(ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)
+    family_id : Mapped[str] = mapped_column(String(32), nullable=False, index=True)
+    token_hash : Mapped[str] = mapped_column(String(64), nullable=False, unique=True, index=True)
+
+    created_at : Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    expires_at : Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    revoked_at : Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -0,0 +1,21 @@
+from sqlalchemy import Date, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from datetime import date
+from db.base import Base
+
+
+class TermDailyCount(Base):
+    """How many feedbacks mentioned a term on a given (UTC) day.
+
+    Size grows with days x vocabulary, not with the number of feedbacks, so
+    period reports stay cheap however much text comes in.
+    """
+    __tablename__ = 'term_daily_counts'
+    # Cluster rows by (day, term) on SQLite so a period is one contiguous range read.
+    __table_args__ = {'sqlite_with_rowid': False}
+
+    # Primary key order matters: period reports filter on a day range.
+    day : Mapped[date] = mapped_column(Date, primary_key=True)
+    term : Mapped[str] = mapped_column(String(80), primary_key=True)
+    count : Mapped[int] = mapped_column(Integer, nullable=False, server_default='0')
@@ -0,0 +1,27 @@
+import json
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict, field_validator
+
+
+class AuditEntryOut(BaseModel):
+    model_config=ConfigDict(from_attributes=True)
+
+    id : int
+    created_at : datetime
+    actor_id : int | None
+    actor_email : str | None
+    action : str
+    target_type : str | None
+    target_id : int | None
+    details : dict
+
+    @field_validator('details', mode='before')
+    @classmethod
+    def parse_details(cls, value):
+        return json.loads(value) if isinstance(value, str) else value
+
+
+class AuditPage(BaseModel):
+    items : list[AuditEntryOut]
+    # Pass as `before_id` to get the next (older) page; null on the last page.
+    next_before_id : int | None
@@ -3,6 +3,11 @@ from pydantic import BaseModel, Field, EmailStr
 class Token(BaseModel):
     access_token : str
     token_type : str = Field(default='bearer')
+    refresh_token : str | None = None
+
+
+class RefreshRequest(BaseModel):
+    refresh_token : str
 
 
 class BootstrapAdmin(BaseModel):
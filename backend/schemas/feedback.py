@@ -23,3 +23,22 @@ class FeedbackOut(BaseModel):
     created_at : datetime
     source : str | None
     is_approved : bool
+
+
+class FeedbackImportRow(FeedbackCreate):
+    created_at : datetime | None = None
+    is_approved : bool = False
+    source : str | None = Field(default=None, max_length=150)
+
+
+class FeedbackImportError(BaseModel):
+    row : int
+    error : str
+
+
+class FeedbackImportReport(BaseModel):
+    inserted : int
+    failed : int
+    errors : list[FeedbackImportError]
+    elapsed_seconds : float
+    rows_per_second : float
@@ -0,0 +1,18 @@
+from datetime import date
+from pydantic import BaseModel
+
+
+class TrendTerm(BaseModel):
+    term : str
+    count : int
+    baseline_count : int
+    # Daily mention rate in the period relative to the baseline (smoothed, so new terms stay finite).
+    change : float
+
+
+class TrendReport(BaseModel):
+    period_start : date
+    period_end : date
+    baseline_start : date
+    top : list[TrendTerm]
+    rising : list[TrendTerm]
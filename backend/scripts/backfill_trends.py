@@ -0,0 +1,147 @@
+"""Rebuild the per-day term counters (`term_daily_counts`) from stored feedback.
+
+Run from `backend/`:
+
+    python -m scripts.backfill_trends                      # all history up to yesterday
+    python -m scripts.backfill_trends --since 2026-01-01 --until 2026-02-01
+    python -m scripts.backfill_trends --dry-run            # count only, write nothing
+
+Days in [since, until) are replaced, so the job can be re-run safely. `until`
+defaults to today (UTC), whose counts come from the live counter. Texts are
+tokenized with the same tokenizer as live traffic. Counting and merging
+(day, term) pairs across batches is done with numpy.
+"""
+import argparse
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from itertools import repeat
+
+import numpy as np
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.trends import extract_terms
+from models.feedback import FeedBack
+from models.term_daily_count import TermDailyCount
+
+# (day ordinal, term id) packed into one int64 key; term ids stay below 2**32.
+TERM_BITS = 32
+
+
+@dataclass
+class BackfillStats:
+    feedbacks : int
+    counters : int
+    elapsed_seconds : float
+
+
+class TermDayCounter:
+    def __init__(self) -> None:
+        self.term_ids : dict[str, int] = {}
+        self.keys = np.empty(0, dtype=np.int64)
+        self.counts = np.empty(0, dtype=np.int64)
+
+    def add_batch(self, rows : list[tuple[datetime, str]]) -> None:
+        days : list[int] = []
+        terms : list[int] = []
+        ids = self.term_ids
+        for created_at, text in rows:
+            if created_at.tzinfo is not None:
+                created_at = created_at.astimezone(timezone.utc)
+            row_terms = extract_terms(text)
+            days.extend(repeat(created_at.date().toordinal(), len(row_terms)))
+            terms.extend([ids.setdefault(term, len(ids)) for term in row_terms])
+        if not days:
+            return
+        keys = (np.asarray(days, dtype=np.int64) << TERM_BITS) | np.asarray(terms, dtype=np.int64)
+        batch_keys, batch_counts = np.unique(keys, return_counts=True)
+        # Merge with the running totals: unique over both, summing counts per key.
+        merged, inverse = np.unique(np.concatenate([self.keys, batch_keys]), return_inverse=True)
+        self.counts = np.bincount(inverse, weights=np.concatenate([self.counts, batch_counts])).astype(np.int64)
+        self.keys = merged
+
+    def rows(self) -> list[dict]:
+        terms = np.asarray(list(self.term_ids), dtype=object)
+        days = self.keys >> TERM_BITS
+        term_ids = self.keys & ((1 << TERM_BITS) - 1)
+        return [
+            {'day': date.fromordinal(d), 'term': t, 'count': c}
+            for d, t, c in zip(days.tolist(), terms[term_ids].tolist(), self.counts.tolist())
+        ]
+
+
+async def backfill_terms(
+    db : AsyncSession,
+    *,
+    since : date | None,
+    until : date,
+    batch_size : int = 20000,
+    dry_run : bool = False,
+) -> BackfillStats:
+    started = time.perf_counter()
+    until_at = datetime.combine(until, datetime.min.time(), tzinfo=timezone.utc)
+    stmt = select(FeedBack.created_at, FeedBack.text).where(FeedBack.created_at < until_at)
+    if since is not None:
+        stmt = stmt.where(FeedBack.created_at >= datetime.combine(since, datetime.min.time(), tzinfo=timezone.utc))
+
+    counter = TermDayCounter()
+    feedbacks = 0
+    result = await db.stream(stmt.execution_options(yield_per=batch_size))
+    async for partition in result.partitions():
+        counter.add_batch(partition)
+        feedbacks += len(partition)
+
+    rows = counter.rows()
+    if not dry_run:
+        replace = delete(TermDailyCount).where(TermDailyCount.day < until)
+        if since is not None:
+            replace = replace.where(TermDailyCount.day >= since)
+        await db.execute(replace)
+        for offset in range(0, len(rows), batch_size):
+            await db.execute(insert(TermDailyCount.__table__), rows[offset:offset + batch_size])
+        await db.commit()
+    return BackfillStats(
+        feedbacks=feedbacks,
+        counters=len(rows),
+        elapsed_seconds=round(time.perf_counter() - started, 3),
+    )
+
+
+async def run(args : argparse.Namespace) -> None:
+    from db.session import dispose_engine, get_sessionmaker
+
+    try:
+        async with get_sessionmaker()() as db:
+            stats = await backfill_terms(
+                db,
+                since=args.since,
+                until=args.until,
+                batch_size=args.batch_size,
+                dry_run=args.dry_run,
+            )
+    finally:
+        await dispose_engine()
+    rate = stats.feedbacks / stats.elapsed_seconds if stats.elapsed_seconds else 0
+    print(
+        f'feedbacks={stats.feedbacks} counters={stats.counters} '
+        f'elapsed={stats.elapsed_seconds}s rate={rate:,.0f} feedbacks/s dry_run={args.dry_run}'
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--since', type=date.fromisoformat, help='first day to rebuild (default: all history)')
+    parser.add_argument('--until', type=date.fromisoformat, help='first day NOT rebuilt (default: today, UTC)')
+    parser.add_argument('--batch-size', type=int, default=20000)
+    parser.add_argument('--dry-run', action='store_true', help='count only, do not write')
+    args = parser.parse_args()
+    args.until = args.until or datetime.now(timezone.utc).date()
+    if args.since is not None and args.since >= args.until:
+        parser.error('--since must be before --until')
+    asyncio.run(run(args))
+
+
+if __name__ == '__main__':
+    main()
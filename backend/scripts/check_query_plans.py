@@ -0,0 +1,60 @@
+"""Fail when a registered hot query's plan degrades to a sequential scan or a full sort.
+
+Run from `backend/` against a scratch or staging database:
+
+    python -m scripts.check_query_plans --seed-rows 100000
+
+Seeded rows are inserted inside a transaction that is rolled back at the end, so
+the database is left untouched. Uses EXPLAIN QUERY PLAN on SQLite and
+EXPLAIN (FORMAT JSON) on Postgres.
+"""
+import argparse
+import asyncio
+import sys
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.query_plans import check_hot_queries
+from db.session import dispose_engine, get_engine
+
+
+async def run(seed_rows : int) -> int:
+    engine = get_engine()
+    try:
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            try:
+                if seed_rows:
+                    from crud.feedback_import import insert_feedback_rows
+                    from scripts.seed_feedback import SeedProfile, generate_batches, to_rows
+
+                    session = AsyncSession(bind=conn)
+                    for batch in generate_batches(SeedProfile(rows=seed_rows), batch_size=20000):
+                        await insert_feedback_rows(session, to_rows(batch))
+                    await conn.execute(text('ANALYZE'))
+                reports = await conn.run_sync(check_hot_queries)
+            finally:
+                await transaction.rollback()
+    finally:
+        await dispose_engine()
+
+    failed = 0
+    for report in reports:
+        print(f"{'ok  ' if report.ok else 'FAIL'} {report.name}")
+        for line in report.plan:
+            print(f'       {line}')
+        for violation in report.violations:
+            print(f'     ! {violation}')
+        failed += not report.ok
+    return 1 if failed else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--seed-rows', type=int, default=0, help='synthetic feedback rows to add before explaining')
+    sys.exit(asyncio.run(run(parser.parse_args().seed_rows)))
+
+
+if __name__ == '__main__':
+    main()
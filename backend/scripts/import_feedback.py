@@ -0,0 +1,61 @@
+"""Bulk-load historical feedback from a CSV or NDJSON file.
+
+Run from `backend/`:
+
+    python -m scripts.import_feedback path/to/feedback.csv --source paper-forms
+
+Columns / keys: type, rating, text, name, contact and optionally created_at,
+is_approved, source. `-` reads from stdin (pass --format).
+"""
+import argparse
+import asyncio
+import sys
+
+from core.config import get_settings
+from core.trends import trend_counter
+from crud.feedback_import import detect_format, import_feedback
+from db.session import dispose_engine, get_sessionmaker
+
+
+async def run(args : argparse.Namespace) -> int:
+    fmt = args.format or detect_format(args.path)
+    if fmt is None:
+        print('Cannot detect file format, pass --format csv|ndjson', file=sys.stderr)
+        return 2
+
+    settings = get_settings()
+    trend_counter.configure(
+        enabled=settings.TRENDS_ENABLED,
+        session_factory=get_sessionmaker(),
+        flush_interval=settings.TRENDS_FLUSH_SECONDS,
+    )
+    stream = sys.stdin if args.path == '-' else open(args.path, encoding='utf-8-sig', newline='')
+    try:
+        async with get_sessionmaker()() as db:
+            report = await import_feedback(db, stream, fmt, source=args.source, chunk_size=args.chunk_size)
+        await trend_counter.stop()
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+        await dispose_engine()
+
+    for error in report.errors:
+        print(f'row {error.row}: {error.error}', file=sys.stderr)
+    print(
+        f'inserted={report.inserted} failed={report.failed} '
+        f'elapsed={report.elapsed_seconds}s rate={report.rows_per_second} rows/s'
+    )
+    return 1 if report.failed else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path', help='CSV/NDJSON file, or - for stdin')
+    parser.add_argument('--format', choices=('csv', 'ndjson'))
+    parser.add_argument('--source', help='value for `source` when a row does not set one')
+    parser.add_argument('--chunk-size', type=int, default=5000)
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,178 @@
+"""Generate large volumes of realistic synthetic feedback for scale and load tests.
+
+Run from `backend/`:
+
+    python -m scripts.seed_feedback --rows 1000000
+    python -m scripts.seed_feedback --rows 200000 --years 5 --approval-ratio 0.6 \\
+        --source-mix none=0.7,paper-forms=0.2,old-tool=0.1
+    python -m scripts.seed_feedback --rows 1000000 --dry-run   # generator speed only
+
+Rows are produced column-wise with numpy in batches and written with the same
+loader as the bulk import (COPY on Postgres, executemany on SQLite).
+"""
+import argparse
+import asyncio
+import sys
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+import numpy as np
+
+# Rating distribution skews positive like real restaurant reviews (index 0 -> rating 1).
+DEFAULT_RATING_WEIGHTS = (0.03, 0.02, 0.03, 0.04, 0.06, 0.08, 0.12, 0.18, 0.2, 0.24)
+
+FIRST_NAMES = (
+    'Айгерим', 'Данияр', 'Алия', 'Тимур', 'Мария', 'Ерлан', 'Анна', 'Асель', 'Дмитрий', 'Жанна',
+    'Нурлан', 'Елена', 'Арман', 'Ольга', 'Санжар', 'Дина', 'Иван', 'Камила', 'Максим', 'Гульнара',
+)
+
+# Zipf-like vocabulary: earlier words are drawn more often, which gives the
+# trend analytics and text search something realistic to chew on.
+VOCABULARY = (
+    'очень', 'вкусно', 'обслуживание', 'официант', 'было', 'всё', 'блюда', 'спасибо', 'еда', 'долго',
+    'ждали', 'атмосфера', 'уютно', 'вернёмся', 'порции', 'цены', 'десерт', 'кофе', 'чай', 'музыка',
+    'плов', 'бешбармак', 'шашлык', 'салат', 'суп', 'лагман', 'манты', 'баурсаки', 'стейк', 'пицца',
+    'холодный', 'горячий', 'свежий', 'быстро', 'медленно', 'приятный', 'персонал', 'чисто', 'шумно', 'тихо',
+    'время', 'ожидания', 'заказ', 'счёт', 'бронь', 'столик', 'терраса', 'детское', 'меню', 'парковка',
+    'рекомендую', 'понравилось', 'не', 'понравилось', 'дорого', 'недорого', 'большие', 'маленькие', 'вечер', 'обед',
+)
+
+
+@dataclass
+class SeedProfile:
+    rows : int
+    years : float = 3.0
+    approval_ratio : float = 0.7
+    suggestion_ratio : float = 0.2
+    rating_weights : tuple[float, ...] = DEFAULT_RATING_WEIGHTS
+    text_words_median : float = 18.0
+    text_words_sigma : float = 0.8
+    sources : dict[str | None, float] = field(default_factory=lambda: {None: 0.85, 'paper-forms': 0.1, 'old-tool': 0.05})
+    seed : int = 42
+
+
+def parse_source_mix(value : str) -> dict[str | None, float]:
+    mix : dict[str | None, float] = {}
+    for part in value.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        mix[None if name.lower() == 'none' else name] = float(weight)
+    return mix
+
+
+def _normalized(weights) -> np.ndarray:
+    arr = np.asarray(weights, dtype=np.float64)
+    return arr / arr.sum()
+
+
+def build_text_pool(rng : np.random.Generator, profile : SeedProfile, size : int = 8192) -> np.ndarray:
+    """A pool of distinct texts with log-normal lengths; rows sample from it by index."""
+    vocab = np.asarray(VOCABULARY, dtype=object)
+    word_probs = _normalized(1.0 / np.arange(1, len(vocab) + 1))
+    lengths = np.clip(
+        rng.lognormal(np.log(profile.text_words_median), profile.text_words_sigma, size).astype(np.int64),
+        1,
+        400,
+    )
+    words = rng.choice(vocab, size=int(lengths.sum()), p=word_probs)
+    bounds = np.cumsum(lengths)[:-1]
+    texts = [' '.join(chunk).capitalize() for chunk in np.split(words, bounds)]
+    return np.asarray(texts, dtype=object)
+
+
+def generate_batches(profile : SeedProfile, batch_size : int) -> Iterator[dict[str, list]]:
+    """Yield column-oriented batches: {'type': [...], 'rating': [...], ...}."""
+    rng = np.random.default_rng(profile.seed)
+    texts = build_text_pool(rng, profile)
+    names = np.asarray(FIRST_NAMES, dtype=object)
+    source_values = np.asarray(list(profile.sources), dtype=object)
+    source_probs = _normalized(list(profile.sources.values()))
+    rating_probs = _normalized(profile.rating_weights)
+    now = time.time()
+    span = profile.years * 365 * 24 * 3600
+
+    produced = 0
+    while produced < profile.rows:
+        size = min(batch_size, profile.rows - produced)
+        ratings = rng.choice(np.arange(1, len(rating_probs) + 1), size=size, p=rating_probs)
+        is_suggestion = rng.random(size) < profile.suggestion_ratio
+        name_ids = rng.integers(0, len(names), size)
+        serials = np.arange(produced, produced + size)
+        timestamps = np.sort(now - rng.random(size) * span)
+        yield {
+            'type': np.where(is_suggestion, 'suggestion', 'review').tolist(),
+            'rating': ratings.tolist(),
+            'text': texts[rng.integers(0, len(texts), size)].tolist(),
+            'name': names[name_ids].tolist(),
+            'contact': np.char.add('@guest', serials.astype(str)).tolist(),
+            'is_approved': (rng.random(size) < profile.approval_ratio).tolist(),
+            'created_at': [datetime.fromtimestamp(ts, tz=timezone.utc) for ts in timestamps.tolist()],
+            'source': source_values[rng.choice(len(source_values), size=size, p=source_probs)].tolist(),
+        }
+        produced += size
+
+
+def to_rows(batch : dict[str, list]) -> list[dict]:
+    columns = list(batch)
+    return [dict(zip(columns, values)) for values in zip(*batch.values())]
+
+
+async def seed(profile : SeedProfile, batch_size : int, dry_run : bool) -> None:
+    from crud.feedback_import import insert_feedback_rows
+    from db.session import dispose_engine, get_sessionmaker
+
+    started = time.perf_counter()
+    written = 0
+    try:
+        for batch in generate_batches(profile, batch_size):
+            rows = to_rows(batch)
+            if not dry_run:
+                async with get_sessionmaker()() as db:
+                    await insert_feedback_rows(db, rows)
+                    await db.commit()
+            written += len(rows)
+            elapsed = time.perf_counter() - started
+            print(f'\r{written}/{profile.rows} rows, {written / elapsed:,.0f} rows/s', end='', file=sys.stderr)
+    finally:
+        await dispose_engine()
+    elapsed = time.perf_counter() - started
+    print(file=sys.stderr)
+    print(f'seeded={written} elapsed={elapsed:.2f}s rate={written / elapsed:,.0f} rows/s dry_run={dry_run}')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, required=True)
+    parser.add_argument('--batch-size', type=int, default=20000)
+    parser.add_argument('--years', type=float, default=3.0, help='spread created_at over this many past years')
+    parser.add_argument('--approval-ratio', type=float, default=0.7)
+    parser.add_argument('--suggestion-ratio', type=float, default=0.2)
+    parser.add_argument('--rating-weights', help='10 comma-separated weights for ratings 1..10')
+    parser.add_argument('--text-words', type=float, default=18.0, help='median words per text')
+    parser.add_argument('--source-mix', help='e.g. none=0.8,paper-forms=0.15,old-tool=0.05')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--dry-run', action='store_true', help='generate only, do not write')
+    args = parser.parse_args()
+
+    profile = SeedProfile(
+        rows=args.rows,
+        years=args.years,
+        approval_ratio=args.approval_ratio,
+        suggestion_ratio=args.suggestion_ratio,
+        text_words_median=args.text_words,
+        seed=args.seed,
+    )
+    if args.rating_weights:
+        profile.rating_weights = tuple(float(w) for w in args.rating_weights.split(','))
+        if len(profile.rating_weights) != 10:
+            parser.error('--rating-weights needs exactly 10 values')
+    if args.source_mix:
+        profile.sources = parse_source_mix(args.source_mix)
+
+    asyncio.run(seed(profile, args.batch_size, args.dry_run))
+
+
+if __name__ == '__main__':
+    main()
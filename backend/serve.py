@@ -0,0 +1,76 @@
+"""Production entry point: multi-worker uvicorn with uvloop/httptools.
+
+Usage: `python serve.py` (see docs/DEPLOY.md). For local development keep
+using `uvicorn main:app --reload`.
+"""
+import math
+import os
+from pathlib import Path
+
+import uvicorn
+
+from core.config import get_settings
+
+
+def _cgroup_cpu_quota() -> float | None:
+    try:
+        # cgroup v2: "<quota> <period>" or "max <period>"
+        quota, period = Path('/sys/fs/cgroup/cpu.max').read_text().split()[:2]
+        return None if quota == 'max' else int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    try:
+        quota = int(Path('/sys/fs/cgroup/cpu/cpu.cfs_quota_us').read_text())
+        period = int(Path('/sys/fs/cgroup/cpu/cpu.cfs_period_us').read_text())
+        return quota / period if quota > 0 else None
+    except (OSError, ValueError):
+        return None
+
+
+def available_cpus() -> int:
+    """CPUs this process may use; `os.cpu_count()` reports the host's cores and ignores container limits."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    quota = _cgroup_cpu_quota()
+    if quota is not None:
+        cpus = min(cpus, max(1, math.floor(quota)))
+    return cpus
+
+
+def worker_count() -> int:
+    settings = get_settings()
+    if settings.WEB_CONCURRENCY > 0:
+        return settings.WEB_CONCURRENCY
+    return available_cpus()
+
+
+def main() -> None:
+    settings = get_settings()
+    workers = worker_count()
+    if workers > 1 and not settings.idempotency_db_enabled():
+        raise SystemExit(
+            f'{workers} workers need the shared idempotency table: unset IDEMPOTENCY_DB_ENABLED '
+            'or set it to true, or run with WEB_CONCURRENCY=1'
+        )
+    # The app is passed as an import string so each worker imports it (and builds
+    # its engine in the lifespan) in its own process. On SIGTERM uvicorn stops
+    # accepting connections, waits for in-flight requests up to the graceful
+    # timeout, then runs the lifespan shutdown in every worker.
+    uvicorn.run(
+        'main:app',
+        host=settings.HOST,
+        port=settings.PORT,
+        workers=workers,
+        loop='uvloop',
+        http='httptools',
+        proxy_headers=True,
+        forwarded_allow_ips='*',
+        timeout_graceful_shutdown=settings.GRACEFUL_SHUTDOWN_SECONDS,
+        access_log=False,
+    )
+
+
+if __name__ == '__main__':
+    main()
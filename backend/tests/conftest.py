@@ -1,72 +1,180 @@
 import os
-import tempfile
+import uuid
 from collections.abc import AsyncGenerator, Generator
 
 import pytest
 import pytest_asyncio
+from passlib.context import CryptContext
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
 
 # Ensure settings can initialize in test context before app/security imports.
 os.environ.setdefault("JWT_SECRET_KEY", "test-secret")
 os.environ.setdefault("JWT_ALG", "HS256")
-os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///./test_bootstrap.db")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
 
+import models.feed_version  # noqa: F401
 import models.feedback  # noqa: F401
+import models.idempotency_key  # noqa: F401
+import models.refresh_token  # noqa: F401
 import models.moderation_settings  # noqa: F401
 import models.user  # noqa: F401
+from core.audit import audit_trail
+from core.health import liveness_probe, loop_lag_monitor, readiness_probe
+from core.idempotency import idempotency_store
+from core.load_shedding import load_shedder
+from core.public_feed import public_feed
+import core.security
 from core.security import create_access, hash_password
+from core.trends import trend_counter
 from db.base import Base
-from db.session import get_db
+from db.session import get_db, get_engine
 from main import app
 from models.user import User
 
 
+def create_test_engine() -> AsyncEngine:
+    """In-memory SQLite pinned to one connection, with working SAVEPOINTs.
+
+    Every process (including each pytest-xdist worker) gets its own database.
+    """
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+    # pysqlite's implicit transaction handling breaks SAVEPOINT; let SQLAlchemy
+    # emit BEGIN itself so nested transactions work.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_implicit_begin(dbapi_connection, _record) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _begin(conn) -> None:
+        conn.exec_driver_sql("BEGIN")
+
+    return engine
+
+
 @pytest.fixture(scope="session", autouse=True)
 def test_env() -> Generator[None, None, None]:
     yield
 
 
-@pytest_asyncio.fixture()
-async def db_session_factory() -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
-    fd, db_path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-    db_url = f"sqlite+aiosqlite:///{db_path}"
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing() -> Generator[None, None, None]:
+    """Minimal argon2 cost parameters, so hashing does not dominate the suite."""
+    context = CryptContext(
+        schemes=["argon2"],
+        deprecated="auto",
+        argon2__time_cost=1,
+        argon2__memory_cost=8,
+        argon2__parallelism=1,
+    )
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(core.security, "get_pwd_context", lambda: context)
+        yield
 
-    engine = create_async_engine(db_url, future=True)
-    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+@pytest_asyncio.fixture(scope="session")
+async def db_engine() -> AsyncGenerator[AsyncEngine, None]:
+    engine = create_test_engine()
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
 
+
+@pytest_asyncio.fixture(scope="session")
+async def probe_engine() -> AsyncGenerator[AsyncEngine, None]:
+    # Health checks open and return their own connections; returning a pooled
+    # connection rolls it back, so they must not share the test connection.
+    engine = create_test_engine()
     try:
-        yield session_factory
+        yield engine
     finally:
         await engine.dispose()
-        if os.path.exists(db_path):
-            os.remove(db_path)
+
+
+@pytest_asyncio.fixture()
+async def fresh_engine() -> AsyncGenerator[AsyncEngine, None]:
+    """A separate database with a real connection pool, for pool/warmup tests."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///file:fresh-{uuid.uuid4().hex}?mode=memory&cache=shared&uri=true",
+        poolclass=AsyncAdaptedQueuePool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+@pytest_asyncio.fixture()
+async def db_connection(db_engine: AsyncEngine) -> AsyncGenerator[AsyncConnection, None]:
+    async with db_engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            yield conn
+        finally:
+            await transaction.rollback()
+
+
+@pytest_asyncio.fixture()
+async def db_session_factory(db_connection: AsyncConnection) -> async_sessionmaker[AsyncSession]:
+    # Sessions commit into SAVEPOINTs; the outer transaction is rolled back
+    # after the test, so the schema is created once per session.
+    return async_sessionmaker(
+        bind=db_connection,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
 
 
 @pytest_asyncio.fixture()
 async def api_client(
     db_session_factory: async_sessionmaker[AsyncSession],
+    probe_engine: AsyncEngine,
 ) -> AsyncGenerator[AsyncClient, None]:
     async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
         async with db_session_factory() as session:
             yield session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_engine] = lambda: probe_engine
+    public_feed.clear()
+    idempotency_store.clear()
+    load_shedder.clear()
+    audit_trail.clear()
+    trend_counter.clear()
+    liveness_probe.clear()
+    loop_lag_monitor.clear()
+    readiness_probe.clear()
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as client:
         yield client
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(scope="session")
+def admin_password_hash(fast_password_hashing: None) -> str:
+    return hash_password("admin123")
+
+
 @pytest_asyncio.fixture()
 async def admin_auth_header(
     db_session_factory: async_sessionmaker[AsyncSession],
+    admin_password_hash: str,
 ) -> dict[str, str]:
     async with db_session_factory() as session:
-        user = User(email="admin@test.local", hashed_password=hash_password("admin123"))
+        user = User(email="admin@test.local", hashed_password=admin_password_hash)
         session.add(user)
         await session.commit()
         await session.refresh(user)
@@ -0,0 +1,164 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.audit import AuditEvent, AuditTrail, DatabaseAuditSink, FileAuditSink, audit_trail
+
+
+class FlakySink:
+    def __init__(self) -> None:
+        self.fail = True
+        self.written: list[AuditEvent] = []
+
+    async def write(self, events: list[AuditEvent]) -> None:
+        if self.fail:
+            raise ConnectionError("database down")
+        self.written.extend(events)
+
+
+@pytest.mark.asyncio
+async def test_moderation_actions_are_buffered_then_queryable(
+    api_client: AsyncClient,
+    admin_auth_header: dict[str, str],
+    db_session_factory: async_sessionmaker[AsyncSession],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(audit_trail, "sink", DatabaseAuditSink(db_session_factory))
+    created = await api_client.post("/api/v1/feedback/create", json={
+        "type": "review",
+        "rating": 4,
+        "text": "Cold soup",
+        "name": "Audit Guest",
+        "contact": "@audit",
+    })
+    f_id = created.json()["id"]
+    await api_client.patch(f"/api/v1/feedback/admin/{f_id}/approve", headers=admin_auth_header)
+    await api_client.patch(
+        "/api/v1/feedback/admin/settings/moderation",
+        headers=admin_auth_header,
+        json={"auto_approve_enabled": True, "manual_review_rating_threshold": 8},
+    )
+    await api_client.delete(f"/api/v1/feedback/delete/{f_id}", headers=admin_auth_header)
+
+    # Nothing is written on the request path.
+    assert len(audit_trail) == 3
+    empty = await api_client.get("/api/v1/admin/audit", headers=admin_auth_header)
+    assert empty.json() == {"items": [], "next_before_id": None}
+
+    assert await audit_trail.flush() == 3
+    page = (await api_client.get("/api/v1/admin/audit?limit=2", headers=admin_auth_header)).json()
+    assert [item["action"] for item in page["items"]] == ["feedback.delete", "moderation.update"]
+    assert page["items"][0]["details"] == {"was_approved": True}
+    assert page["items"][0]["actor_email"] == "admin@test.local"
+    assert page["items"][1]["details"]["manual_review_rating_threshold"] == 8
+
+    rest = (await api_client.get(
+        f"/api/v1/admin/audit?limit=2&before_id={page['next_before_id']}",
+        headers=admin_auth_header,
+    )).json()
+    assert [item["action"] for item in rest["items"]] == ["feedback.approve"]
+    assert rest["items"][0]["target_id"] == f_id
+    assert rest["next_before_id"] is None
+
+    filtered = (await api_client.get(
+        "/api/v1/admin/audit?action=feedback.approve",
+        headers=admin_auth_header,
+    )).json()
+    assert [item["target_id"] for item in filtered["items"]] == [f_id]
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_stays_buffered_until_sink_recovers() -> None:
+    sink = FlakySink()
+    trail = AuditTrail(max_buffer=100, batch_size=2)
+    trail.sink = sink
+    for i in range(3):
+        trail.record("feedback.approve", target_type="feedback", target_id=i)
+
+    assert await trail.flush() == 0
+    assert len(trail) == 3
+
+    sink.fail = False
+    await trail.stop()
+    assert [e.target_id for e in sink.written] == [0, 1, 2]
+    assert len(trail) == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_drops_oldest_when_buffer_refilled() -> None:
+    trail = AuditTrail(max_buffer=3, batch_size=2)
+
+    class FailingWhileBusySink:
+        async def write(self, events: list[AuditEvent]) -> None:
+            # New events arrive while the batch is being written, then the write fails.
+            trail.record("feedback.delete", target_id=3)
+            trail.record("feedback.delete", target_id=4)
+            raise ConnectionError("database down")
+
+    trail.sink = FailingWhileBusySink()
+    for i in range(3):
+        trail.record("feedback.delete", target_id=i)
+
+    assert await trail.flush() == 0
+    assert [event.target_id for event in trail._buffer] == [2, 3, 4]
+    assert trail.dropped == 2
+
+
+def test_buffer_is_bounded_and_counts_drops() -> None:
+    trail = AuditTrail(max_buffer=3)
+    for i in range(5):
+        trail.record("feedback.delete", target_id=i)
+
+    assert len(trail) == 3
+    assert trail.dropped == 2
+
+
+@pytest.mark.asyncio
+async def test_file_sink_writes_json_lines_and_rotates(tmp_path) -> None:
+    path = tmp_path / "audit.log"
+    trail = AuditTrail(batch_size=10)
+    trail.sink = FileAuditSink(str(path), max_bytes=400, backup_count=2)
+    for i in range(6):
+        trail.record("admin.create", target_type="user", target_id=i, email=f"admin{i}@test.local")
+    await trail.stop()
+
+    # One file per worker slot.
+    name = "audit.0.log"
+    assert trail.sink.path == str(tmp_path / name)
+    lines = [
+        json.loads(line)
+        for file_name in (f"{name}.2", f"{name}.1", name)
+        if (tmp_path / file_name).exists()
+        for line in (tmp_path / file_name).read_text(encoding="utf-8").splitlines()
+    ]
+    assert (tmp_path / f"{name}.1").exists()
+    assert [line["target_id"] for line in lines][-2:] == [4, 5]
+    assert lines[-1]["details"] == {"email": "admin5@test.local"}
+
+
+@pytest.mark.asyncio
+async def test_restarted_worker_reuses_its_file_slot(tmp_path) -> None:
+    path = str(tmp_path / "audit.log")
+    other_worker = FileAuditSink(path, max_bytes=200, backup_count=2)
+    assert other_worker.path.endswith("audit.0.log")
+
+    for restart in range(5):
+        # Each "process" writes enough to rotate, then dies (its slot lock is released).
+        sink = FileAuditSink(path, max_bytes=200, backup_count=2)
+        assert sink.path.endswith("audit.1.log")
+        await sink.write([
+            AuditEvent("feedback.delete", None, None, "feedback", restart * 10 + i) for i in range(10)
+        ])
+        sink.close()
+    other_worker.close()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "audit.0.log",
+        "audit.0.log.lock",
+        "audit.1.log",
+        "audit.1.log.1",
+        "audit.1.log.2",
+        "audit.1.log.lock",
+    ]
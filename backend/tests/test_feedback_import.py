@@ -0,0 +1,117 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+
+
+CSV_BODY = (
+    "type,rating,text,name,contact,created_at,is_approved,source\n"
+    "review,9,\"Great plov, slow service\",Aigerim,@aigerim,2023-05-01T12:00:00+00:00,true,\n"
+    "suggestion,5,Add a kids menu,Daniyar,+7700,,,\n"
+    "review,11,Too high,Broken,@broken,,,\n"
+)
+
+
+@pytest.mark.asyncio
+async def test_csv_import_reports_row_errors(
+    api_client: AsyncClient,
+    admin_auth_header: dict[str, str],
+) -> None:
+    response = await api_client.post(
+        "/api/v1/feedback/admin/import",
+        params={"source": "paper-forms"},
+        headers=admin_auth_header,
+        files={"file": ("legacy.csv", CSV_BODY.encode(), "text/csv")},
+    )
+    assert response.status_code == 200
+    report = response.json()
+    assert report["inserted"] == 2
+    assert report["failed"] == 1
+    assert report["errors"][0]["row"] == 4
+    assert report["errors"][0]["error"].startswith("rating")
+
+    items = (await api_client.get("/api/v1/feedback/admin", headers=admin_auth_header)).json()
+    by_name = {item["name"]: item for item in items}
+    assert by_name["Aigerim"]["is_approved"] is True
+    assert by_name["Aigerim"]["created_at"].startswith("2023-05-01")
+    assert by_name["Daniyar"]["is_approved"] is False
+    assert {item["source"] for item in items} == {"paper-forms"}
+
+    public = (await api_client.get("/api/v1/feedback/")).json()
+    assert [item["name"] for item in public] == ["Aigerim"]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_import(
+    api_client: AsyncClient,
+    admin_auth_header: dict[str, str],
+) -> None:
+    lines = [
+        json.dumps({"type": "review", "rating": 7, "text": "Nice", "name": "Old Tool", "contact": "@x", "source": "old-tool"}),
+        "{not json",
+        "",
+        json.dumps({"type": "review", "rating": 3, "text": "Cold soup", "name": "Old Tool 2", "contact": "@y"}),
+    ]
+    response = await api_client.post(
+        "/api/v1/feedback/admin/import",
+        headers=admin_auth_header,
+        files={"file": ("export.ndjson", "\n".join(lines).encode(), "application/x-ndjson")},
+    )
+    assert response.status_code == 200
+    report = response.json()
+    assert report["inserted"] == 2
+    assert report["failed"] == 1
+    assert report["errors"][0]["row"] == 2
+
+
+@pytest.mark.asyncio
+async def test_import_requires_known_format(
+    api_client: AsyncClient,
+    admin_auth_header: dict[str, str],
+) -> None:
+    response = await api_client.post(
+        "/api/v1/feedback/admin/import",
+        headers=admin_auth_header,
+        files={"file": ("data.txt", b"x", "text/plain")},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_import_requires_auth(api_client: AsyncClient) -> None:
+    response = await api_client.post(
+        "/api/v1/feedback/admin/import",
+        files={"file": ("legacy.csv", CSV_BODY.encode(), "text/csv")},
+    )
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_retried_import_with_new_boundary_is_replayed(
+    api_client: AsyncClient,
+    admin_auth_header: dict[str, str],
+) -> None:
+    async def upload(boundary: str, body: str = CSV_BODY, source: str = "paper-forms"):
+        return await api_client.post(
+            "/api/v1/feedback/admin/import",
+            params={"source": source},
+            headers={
+                **admin_auth_header,
+                "Idempotency-Key": "import-1",
+                "Content-Type": f"multipart/form-data; boundary={boundary}",
+            },
+            files={"file": ("legacy.csv", body.encode(), "text/csv")},
+        )
+
+    first = await upload("first-attempt")
+    retry = await upload("second-attempt")
+    assert first.status_code == 200
+    assert retry.status_code == 200
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert retry.json() == first.json()
+
+    items = (await api_client.get("/api/v1/feedback/admin", headers=admin_auth_header)).json()
+    assert len(items) == 2
+
+    assert (await upload("third-attempt", body=CSV_BODY + "review,8,More,X,@x,,,\n")).status_code == 422
+    assert (await upload("fourth-attempt", source="other")).status_code == 422
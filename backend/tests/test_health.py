@@ -0,0 +1,64 @@
+import asyncio
+import time
+
+import pytest
+from httpx import AsyncClient
+
+from core.health import CachedProbe, ProbeResult, loop_lag_monitor
+from core.startup import startup_state
+
+
+@pytest.mark.asyncio
+async def test_healthz_reports_loop_lag(api_client: AsyncClient) -> None:
+    response = await api_client.get("/healthz")
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["status"] == "ok"
+    assert payload["loop_lag_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_healthz_reports_stall_that_already_ended(api_client: AsyncClient) -> None:
+    loop_lag_monitor.configure(interval=0.01, window=10.0)
+    loop_lag_monitor.start()
+    try:
+        await asyncio.sleep(0.03)
+        time.sleep(0.2)  # a handler blocking the loop, finished before the probe runs
+        await asyncio.sleep(0.03)
+        response = await api_client.get("/healthz")
+    finally:
+        await loop_lag_monitor.stop()
+    assert response.json()["loop_lag_ms"] >= 150
+
+
+@pytest.mark.asyncio
+async def test_readyz_checks_database(api_client: AsyncClient) -> None:
+    startup_state.ready = True
+    try:
+        response = await api_client.get("/readyz")
+    finally:
+        startup_state.ready = False
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["database"]["ok"] is True
+    assert payload["database"]["latency_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_cached_probe_runs_once_per_ttl() -> None:
+    calls = 0
+
+    async def probe() -> ProbeResult:
+        nonlocal calls
+        calls += 1
+        return ProbeResult(ok=True, checks={"calls": calls}, checked_at=time.monotonic())
+
+    cached = CachedProbe(ttl=3600)
+    first, second = await asyncio.gather(cached.get(probe), cached.get(probe))
+    third = await cached.get(probe)
+    assert calls == 1
+    assert first is second is third
+
+    cached.clear()
+    await cached.get(probe)
+    assert calls == 2
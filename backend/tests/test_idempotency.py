@@ -0,0 +1,216 @@
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from core.idempotency import (
+    PENDING_STATUS,
+    DatabaseIdempotencyStore,
+    IdempotencyMiddleware,
+    IdempotencyStore,
+    StoredResponse,
+)
+from db.base import Base
+from models.feedback import FeedBack
+from models.idempotency_key import IdempotencyKey
+
+FEEDBACK_PAYLOAD = {
+    "type": "review",
+    "rating": 7,
+    "text": "Soup was great",
+    "name": "Retry Guest",
+    "contact": "@retry",
+}
+
+
+async def count_feedback(session_factory: async_sessionmaker[AsyncSession]) -> int:
+    async with session_factory() as session:
+        res = await session.execute(select(func.count(FeedBack.id)))
+        return res.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_retried_create_is_replayed(
+    api_client: AsyncClient,
+    db_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    headers = {"Idempotency-Key": "create-1"}
+    first = await api_client.post("/api/v1/feedback/create", json=FEEDBACK_PAYLOAD, headers=headers)
+    second = await api_client.post("/api/v1/feedback/create", json=FEEDBACK_PAYLOAD, headers=headers)
+
+    assert first.status_code == second.status_code == 201
+    assert second.json() == first.json()
+    assert second.headers["idempotent-replayed"] == "true"
+    assert await count_feedback(db_session_factory) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicates_create_one_row(
+    api_client: AsyncClient,
+    db_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    headers = {"Idempotency-Key": "create-concurrent"}
+    responses = await asyncio.gather(*(
+        api_client.post("/api/v1/feedback/create", json=FEEDBACK_PAYLOAD, headers=headers)
+        for _ in range(5)
+    ))
+
+    assert {r.json()["id"] for r in responses} == {responses[0].json()["id"]}
+    assert await count_feedback(db_session_factory) == 1
+
+
+@pytest.mark.asyncio
+async def test_key_reuse_with_different_body_is_rejected(api_client: AsyncClient) -> None:
+    headers = {"Idempotency-Key": "create-2"}
+    await api_client.post("/api/v1/feedback/create", json=FEEDBACK_PAYLOAD, headers=headers)
+    response = await api_client.post(
+        "/api/v1/feedback/create",
+        json={**FEEDBACK_PAYLOAD, "rating": 2},
+        headers=headers,
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_requests_without_key_are_not_deduplicated(
+    api_client: AsyncClient,
+    db_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    await api_client.post("/api/v1/feedback/create", json=FEEDBACK_PAYLOAD)
+    await api_client.post("/api/v1/feedback/create", json=FEEDBACK_PAYLOAD)
+    assert await count_feedback(db_session_factory) == 2
+
+
+@pytest.mark.asyncio
+async def test_retried_delete_replays_success(
+    api_client: AsyncClient,
+    admin_auth_header: dict[str, str],
+) -> None:
+    created = await api_client.post("/api/v1/feedback/create", json=FEEDBACK_PAYLOAD)
+    headers = {**admin_auth_header, "Idempotency-Key": "delete-1"}
+    url = f"/api/v1/feedback/delete/{created.json()['id']}"
+
+    first = await api_client.delete(url, headers=headers)
+    second = await api_client.delete(url, headers=headers)
+    assert first.status_code == second.status_code == 204
+
+    without_key = await api_client.delete(url, headers=admin_auth_header)
+    assert without_key.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_database_store_round_trip(db_session_factory: async_sessionmaker[AsyncSession]) -> None:
+    store = DatabaseIdempotencyStore(db_session_factory)
+    response = StoredResponse(
+        fingerprint="abc",
+        status=201,
+        headers=((b"content-type", b"application/json"),),
+        body=b'{"id":1}',
+        expires_at=4102444800.0,
+    )
+    await store.put("k", response)
+
+    loaded = await store.get("k")
+    assert loaded == response
+    assert await store.get("missing") is None
+
+
+@pytest_asyncio.fixture()
+async def shared_engine(tmp_path) -> AsyncEngine:
+    # A file database so two "workers" use separate connections with real locking.
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'shared.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+class CountingApp:
+    def __init__(self, status: int = 201, delay: float = 0.05) -> None:
+        self.status = status
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self, scope, receive, send) -> None:
+        self.calls += 1
+        while (await receive()).get("more_body"):
+            pass
+        await asyncio.sleep(self.delay)
+        body = f'{{"call":{self.calls}}}'.encode()
+        await send({"type": "http.response.start", "status": self.status, "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": body})
+
+
+def worker_client(inner: CountingApp, engine: AsyncEngine, lock_seconds: float = 5) -> AsyncClient:
+    store = IdempotencyStore()
+    store.configure(
+        ttl=60,
+        max_entries=100,
+        session_factory=async_sessionmaker(bind=engine, expire_on_commit=False),
+        lock_seconds=lock_seconds,
+    )
+    app = IdempotencyMiddleware(inner, store=store)
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicates_on_two_workers_run_once(shared_engine: AsyncEngine) -> None:
+    inner = CountingApp()
+    headers = {"Idempotency-Key": "cross-worker"}
+    async with worker_client(inner, shared_engine) as first, worker_client(inner, shared_engine) as second:
+        responses = await asyncio.gather(
+            first.post("/api/v1/feedback/create", json=FEEDBACK_PAYLOAD, headers=headers),
+            second.post("/api/v1/feedback/create", json=FEEDBACK_PAYLOAD, headers=headers),
+        )
+
+    assert inner.calls == 1
+    assert [r.status_code for r in responses] == [201, 201]
+    assert responses[0].json() == responses[1].json() == {"call": 1}
+    assert sorted(r.headers.get("idempotent-replayed", "") for r in responses) == ["", "true"]
+
+
+@pytest.mark.asyncio
+async def test_server_error_releases_reservation(shared_engine: AsyncEngine) -> None:
+    inner = CountingApp(status=503)
+    headers = {"Idempotency-Key": "retry-after-error"}
+    async with worker_client(inner, shared_engine) as first, worker_client(inner, shared_engine) as second:
+        assert (await first.post("/api/v1/feedback/create", json=FEEDBACK_PAYLOAD, headers=headers)).status_code == 503
+        inner.status = 201
+        retried = await second.post("/api/v1/feedback/create", json=FEEDBACK_PAYLOAD, headers=headers)
+
+    assert retried.status_code == 201
+    assert inner.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_reservation_outlives_lock_seconds_while_request_runs(shared_engine: AsyncEngine) -> None:
+    inner = CountingApp(delay=1.0)
+    headers = {"Idempotency-Key": "slow-import"}
+    async with (
+        worker_client(inner, shared_engine, lock_seconds=0.3) as first,
+        worker_client(inner, shared_engine, lock_seconds=0.3) as second,
+    ):
+        running = asyncio.create_task(first.post("/api/v1/feedback/create", json=FEEDBACK_PAYLOAD, headers=headers))
+        await asyncio.sleep(0.5)  # the first reservation would have expired by now
+        duplicate = await second.post("/api/v1/feedback/create", json=FEEDBACK_PAYLOAD, headers=headers)
+        assert (await running).status_code == 201
+        retried = await second.post("/api/v1/feedback/create", json=FEEDBACK_PAYLOAD, headers=headers)
+
+    assert inner.calls == 1
+    assert duplicate.status_code == 409
+    assert retried.headers["idempotent-replayed"] == "true"
+
+
+@pytest.mark.asyncio
+async def test_expired_response_is_taken_over(shared_engine: AsyncEngine) -> None:
+    store = DatabaseIdempotencyStore(async_sessionmaker(bind=shared_engine, expire_on_commit=False))
+    await store.put("old", StoredResponse(fingerprint="abc", status=201, headers=(), body=b"{}", expires_at=time.time() - 1))
+
+    assert await store.reserve("old") is None
+    async with store.session_factory() as db:
+        row = (await db.execute(select(IdempotencyKey).where(IdempotencyKey.key == "old"))).scalar_one()
+    assert row.status_code == PENDING_STATUS
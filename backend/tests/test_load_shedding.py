@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+
+from core.load_shedding import AdaptiveLimit, LoadShedder, RouteClass, classify, load_shedder
+
+CLASSES = (
+    RouteClass("submit", priority=0, max_share=1.0, max_queue=10, queue_timeout=1.0),
+    RouteClass("admin", priority=1, max_share=0.5, max_queue=10, queue_timeout=1.0),
+    RouteClass("public", priority=2, max_share=0.5, max_queue=1, queue_timeout=0.05),
+)
+
+
+def make_shedder(limit: int) -> LoadShedder:
+    shedder = LoadShedder(CLASSES)
+    shedder.configure(
+        enabled=True,
+        initial_limit=limit,
+        min_limit=1,
+        max_limit=limit,
+        latency_target=10.0,
+        retry_after=3,
+    )
+    return shedder
+
+
+def test_routes_are_classified_by_priority_class() -> None:
+    assert classify("POST", "/api/v1/feedback/create") == "submit"
+    assert classify("GET", "/api/v1/feedback/") == "public"
+    assert classify("PATCH", "/api/v1/feedback/admin/3/approve") == "admin"
+    assert classify("DELETE", "/api/v1/feedback/delete/3") == "admin"
+    assert classify("POST", "/api/v1/admin/login") == "admin"
+    assert classify("GET", "/healthz") is None
+    assert classify("GET", "/readyz") is None
+
+
+@pytest.mark.asyncio
+async def test_freed_slot_goes_to_highest_priority_waiter() -> None:
+    shedder = make_shedder(limit=1)
+    assert await shedder.acquire("admin")
+
+    order: list[str] = []
+
+    async def wait(name: str) -> None:
+        assert await shedder.acquire(name)
+        order.append(name)
+        shedder.release(name, 0.01)
+
+    public = asyncio.create_task(wait("public"))
+    await asyncio.sleep(0)
+    submit = asyncio.create_task(wait("submit"))
+    await asyncio.sleep(0)
+    shedder.release("admin", 0.01)
+    await asyncio.gather(public, submit)
+
+    assert order == ["submit", "public"]
+
+
+@pytest.mark.asyncio
+async def test_queue_deadline_and_overflow_are_rejected() -> None:
+    shedder = make_shedder(limit=1)
+    assert await shedder.acquire("submit")
+
+    queued = asyncio.create_task(shedder.acquire("public"))
+    await asyncio.sleep(0)
+    assert await shedder.acquire("public") is False  # queue of 1 is full
+    assert await queued is False  # waited past the 50ms deadline
+    assert shedder.stats()["rejected"]["public"] == 2
+    assert shedder.stats()["queued"]["public"] == 0
+
+
+@pytest.mark.asyncio
+async def test_class_cap_leaves_room_for_guest_submissions() -> None:
+    shedder = make_shedder(limit=4)
+    assert await shedder.acquire("admin")
+    assert await shedder.acquire("admin")
+
+    blocked = asyncio.create_task(shedder.acquire("admin"))
+    await asyncio.sleep(0)
+    assert not blocked.done()
+    assert await shedder.acquire("submit")
+    assert await shedder.acquire("submit")
+    shedder.release("admin", 0.01)
+    assert await blocked
+
+
+@pytest.mark.asyncio
+async def test_capped_waiter_does_not_hold_back_lower_classes() -> None:
+    shedder = make_shedder(limit=20)
+    for _ in range(10):  # the admin cap
+        assert await shedder.acquire("admin")
+    queued_admin = asyncio.create_task(shedder.acquire("admin"))
+    await asyncio.sleep(0)
+
+    # 10 slots are free, only the admin class is full.
+    assert await shedder.acquire("public")
+    assert shedder.stats()["rejected"]["public"] == 0
+
+    shedder.release("public", 0.01)
+    assert not queued_admin.done()
+    shedder.release("admin", 0.01)
+    assert await queued_admin
+
+
+def test_limit_backs_off_on_slow_responses_and_recovers() -> None:
+    limit = AdaptiveLimit(initial=20, min_limit=4, max_limit=40, latency_target=0.0001)
+    limit.update(latency=1.0, inflight=20)
+    assert limit.value == 18
+
+    limit.latency_target = 1.0
+    for _ in range(200):
+        limit.update(latency=0.01, inflight=limit.value)
+    assert limit.value > 18
+
+    idle = limit.value
+    for _ in range(200):
+        limit.update(latency=0.01, inflight=0)
+    assert limit.value == idle
+
+
+@pytest.mark.asyncio
+async def test_overloaded_route_gets_fast_503(api_client: AsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(load_shedder, "limit", AdaptiveLimit(initial=1, min_limit=1, max_limit=1))
+    monkeypatch.setattr(load_shedder, "retry_after", 2)
+    assert await load_shedder.acquire("submit")
+    try:
+        response = await api_client.get("/api/v1/feedback/")
+        health = await api_client.get("/healthz")
+    finally:
+        load_shedder.release("submit", None)
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "2"
+    assert health.status_code == 200
+    assert (await api_client.get("/api/v1/feedback/")).status_code == 200
@@ -0,0 +1,140 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from core.public_feed import PublicFeed, public_feed
+from db.base import Base
+from models.feedback import FeedBack
+
+
+async def create_feedback(api_client: AsyncClient, name: str, rating: int = 8) -> dict:
+    response = await api_client.post(
+        "/api/v1/feedback/create",
+        json={
+            "type": "review",
+            "rating": rating,
+            "text": f"Feedback from {name}",
+            "name": name,
+            "contact": "@guest",
+        },
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_public_feed_reflects_approval_and_delete(
+    api_client: AsyncClient,
+    admin_auth_header: dict[str, str],
+) -> None:
+    created = await create_feedback(api_client, "Pending Guest")
+
+    response = await api_client.get("/api/v1/feedback/")
+    assert response.status_code == 200
+    assert response.json() == []
+
+    approve_response = await api_client.patch(
+        f"/api/v1/feedback/admin/{created['id']}/approve",
+        headers=admin_auth_header,
+    )
+    assert approve_response.status_code == 200
+
+    response = await api_client.get("/api/v1/feedback/")
+    items = response.json()
+    assert [item["name"] for item in items] == ["Pending Guest"]
+    assert items[0] == approve_response.json()
+
+    delete_response = await api_client.delete(
+        f"/api/v1/feedback/delete/{created['id']}",
+        headers=admin_auth_header,
+    )
+    assert delete_response.status_code == 204
+
+    response = await api_client.get("/api/v1/feedback/")
+    assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_public_feed_serves_gzip_and_etag(
+    api_client: AsyncClient,
+    admin_auth_header: dict[str, str],
+) -> None:
+    await api_client.patch(
+        "/api/v1/feedback/admin/settings/moderation",
+        headers=admin_auth_header,
+        json={"auto_approve_enabled": True, "manual_review_rating_threshold": 6},
+    )
+    await create_feedback(api_client, "Happy Guest", rating=9)
+
+    response = await api_client.get("/api/v1/feedback/", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert [item["name"] for item in response.json()] == ["Happy Guest"]
+
+    raw = await api_client.get("/api/v1/feedback/", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in raw.headers
+
+    etag = raw.headers["etag"]
+    cached = await api_client.get("/api/v1/feedback/", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_background_refresher_swaps_in_new_snapshot(
+    api_client: AsyncClient,
+    admin_auth_header: dict[str, str],
+    db_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    created = await create_feedback(api_client, "Refreshed Guest")
+    public_feed.start(db_session_factory, limit=200, interval=60)
+    try:
+        initial = await public_feed.refresh(db_session_factory)
+        assert initial.body == b"[]"
+
+        await api_client.patch(
+            f"/api/v1/feedback/admin/{created['id']}/approve",
+            headers=admin_auth_header,
+        )
+        # With a refresher running, invalidate() keeps the old snapshot and only signals.
+        for _ in range(100):
+            if public_feed.snapshot is not initial:
+                break
+            await asyncio.sleep(0.01)
+        refreshed = public_feed.snapshot
+        assert refreshed is not None and refreshed is not initial
+
+        response = await api_client.get("/api/v1/feedback/")
+        assert [item["name"] for item in response.json()] == ["Refreshed Guest"]
+        assert response.headers["etag"] == refreshed.etag
+    finally:
+        await public_feed.stop()
+
+
+@pytest.mark.asyncio
+async def test_change_on_one_worker_reaches_the_others(tmp_path) -> None:
+    # A file database so the two "workers" use separate connections.
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'feed.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    first, second = PublicFeed(), PublicFeed()
+    for feed in (first, second):
+        feed.start(session_factory, limit=200, interval=60, poll_interval=0.02)
+        await feed.refresh(session_factory)
+    try:
+        async with session_factory() as db:
+            db.add(FeedBack(type="review", rating=9, text="Lovely", name="Elsewhere", contact="@x", is_approved=True))
+            await db.commit()
+        first.invalidate()
+
+        for _ in range(200):
+            if second.snapshot is not None and b"Elsewhere" in second.snapshot.body:
+                break
+            await asyncio.sleep(0.01)
+        assert b"Elsewhere" in second.snapshot.body
+    finally:
+        await first.stop()
+        await second.stop()
+        await engine.dispose()
@@ -0,0 +1,85 @@
+import json
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from crud.feedback_import import insert_feedback_rows
+from db.query_plans import HotQuery, _postgres_plan, check_hot_queries, explain_hot_query
+from models.feedback import FeedBack
+from models.user import User
+from scripts.seed_feedback import SeedProfile, generate_batches, to_rows
+
+
+@pytest.mark.asyncio
+async def test_hot_queries_use_indexes(db_session_factory: async_sessionmaker[AsyncSession]) -> None:
+    async with db_session_factory() as session:
+        for batch in generate_batches(SeedProfile(rows=3000), batch_size=1000):
+            await insert_feedback_rows(session, to_rows(batch))
+        conn = await session.connection()
+        await conn.execute(text("ANALYZE"))
+        reports = await conn.run_sync(check_hot_queries)
+
+    failures = {report.name: (report.plan, report.violations) for report in reports if not report.ok}
+    assert failures == {}
+
+
+@pytest.mark.asyncio
+async def test_plan_guard_flags_scans_and_sorts(db_session_factory: async_sessionmaker[AsyncSession]) -> None:
+    unindexed = HotQuery("feedback.by_contact", lambda: select(FeedBack).where(FeedBack.contact == "@x"))
+    # Both walk a whole index instead of the table; that still reads every row.
+    lowered_email = HotQuery("user.by_lower_email", lambda: select(User.id).where(func.lower(User.email) == "a"))
+    name_contains = HotQuery("feedback.name_contains", lambda: select(FeedBack).where(FeedBack.name.like("%x%")))
+    sorted_by_rating = HotQuery(
+        "feedback.by_rating",
+        lambda: select(FeedBack).where(FeedBack.is_approved.is_(True)).order_by(FeedBack.rating.desc()).limit(10),
+    )
+    async with db_session_factory() as session:
+        conn = await session.connection()
+        scan = await conn.run_sync(explain_hot_query, unindexed)
+        sort = await conn.run_sync(explain_hot_query, sorted_by_rating)
+        index_scan = await conn.run_sync(explain_hot_query, lowered_email)
+        like_scan = await conn.run_sync(explain_hot_query, name_contains)
+
+    assert scan.violations == ["sequential scan on feedbacks"]
+    assert index_scan.violations == ["sequential scan on users (USING COVERING INDEX ix_users_email)"]
+    assert [v.split(" (")[0] for v in like_scan.violations] == ["sequential scan on feedbacks"]
+    assert any(v.startswith("full sort") for v in sort.violations)
+
+
+@pytest.mark.asyncio
+async def test_plan_guard_accepts_index_ordered_top_n(db_session_factory: async_sessionmaker[AsyncSession]) -> None:
+    newest = HotQuery("feedback.newest", lambda: select(FeedBack).order_by(FeedBack.id.desc()).limit(50))
+    everything = HotQuery("feedback.all_by_name", lambda: select(FeedBack).order_by(FeedBack.name))
+    async with db_session_factory() as session:
+        conn = await session.connection()
+        top_n = await conn.run_sync(explain_hot_query, newest)
+        unbounded = await conn.run_sync(explain_hot_query, everything)
+
+    assert top_n.plan == ["SCAN feedbacks"]
+    assert top_n.ok
+    # Same index-ordered walk without a LIMIT reads every row.
+    assert unbounded.violations == ["sequential scan on feedbacks (USING INDEX ix_feedbacks_name)"]
+
+
+class FakePostgres:
+    def __init__(self, plan: dict) -> None:
+        self.plan = plan
+
+    def exec_driver_sql(self, sql: str):
+        plan = self.plan
+
+        class Result:
+            def scalar_one(self):
+                return json.dumps([{"Plan": plan}])
+
+        return Result()
+
+
+def test_postgres_guard_flags_full_index_scans() -> None:
+    full = {"Node Type": "Index Only Scan", "Relation Name": "users", "Index Name": "ix_users_email", "Filter": "lower(email)"}
+    lookup = {**full, "Index Cond": "(email = 'a')"}
+
+    assert _postgres_plan(FakePostgres(full), "")[1] == ["sequential scan on users (USING INDEX ix_users_email)"]
+    assert _postgres_plan(FakePostgres(lookup), "")[1] == []
+    assert _postgres_plan(FakePostgres({"Node Type": "Limit", "Plans": [full]}), "")[1] == []
@@ -0,0 +1,75 @@
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.security import hash_password
+from models.user import User
+
+
+@pytest_asyncio.fixture()
+async def login_tokens(
+    api_client: AsyncClient,
+    db_session_factory: async_sessionmaker[AsyncSession],
+) -> dict[str, str]:
+    async with db_session_factory() as session:
+        session.add(User(email="refresh@test.local", hashed_password=hash_password("admin123")))
+        await session.commit()
+    response = await api_client.post(
+        "/api/v1/admin/login",
+        data={"username": "refresh@test.local", "password": "admin123"},
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+async def refresh(api_client: AsyncClient, refresh_token: str):
+    return await api_client.post("/api/v1/admin/refresh", json={"refresh_token": refresh_token})
+
+
+@pytest.mark.asyncio
+async def test_refresh_rotates_token(api_client: AsyncClient, login_tokens: dict[str, str]) -> None:
+    response = await refresh(api_client, login_tokens["refresh_token"])
+    assert response.status_code == 200
+    rotated = response.json()
+    assert rotated["refresh_token"] != login_tokens["refresh_token"]
+
+    settings_response = await api_client.get(
+        "/api/v1/feedback/admin/settings/moderation",
+        headers={"Authorization": f"Bearer {rotated['access_token']}"},
+    )
+    assert settings_response.status_code == 200
+
+    assert (await refresh(api_client, rotated["refresh_token"])).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_reused_refresh_token_revokes_family(
+    api_client: AsyncClient,
+    login_tokens: dict[str, str],
+) -> None:
+    rotated = (await refresh(api_client, login_tokens["refresh_token"])).json()
+
+    reuse = await refresh(api_client, login_tokens["refresh_token"])
+    assert reuse.status_code == 401
+
+    # The legitimate holder of the newest token is logged out as well.
+    assert (await refresh(api_client, rotated["refresh_token"])).status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_logout_revokes_refresh_token(
+    api_client: AsyncClient,
+    login_tokens: dict[str, str],
+) -> None:
+    response = await api_client.post(
+        "/api/v1/admin/logout",
+        json={"refresh_token": login_tokens["refresh_token"]},
+    )
+    assert response.status_code == 204
+    assert (await refresh(api_client, login_tokens["refresh_token"])).status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_unknown_refresh_token_is_rejected(api_client: AsyncClient) -> None:
+    assert (await refresh(api_client, "not-a-token")).status_code == 401
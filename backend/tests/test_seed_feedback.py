@@ -0,0 +1,39 @@
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from crud.feedback_import import insert_feedback_rows
+from models.feedback import FeedBack
+from scripts.seed_feedback import SeedProfile, generate_batches, parse_source_mix, to_rows
+
+
+def test_generated_batches_follow_profile() -> None:
+    profile = SeedProfile(rows=20000, approval_ratio=0.25, suggestion_ratio=0.5, years=2)
+    batches = list(generate_batches(profile, batch_size=7000))
+
+    assert [len(batch["rating"]) for batch in batches] == [7000, 7000, 6000]
+    rows = [row for batch in batches for row in to_rows(batch)]
+    approved = sum(row["is_approved"] for row in rows) / len(rows)
+    suggestions = sum(row["type"] == "suggestion" for row in rows) / len(rows)
+    assert 0.22 < approved < 0.28
+    assert 0.47 < suggestions < 0.53
+    assert all(1 <= row["rating"] <= 10 for row in rows)
+    assert all(len(row["contact"]) <= 50 and row["text"] for row in rows)
+    span = max(row["created_at"] for row in rows) - min(row["created_at"] for row in rows)
+    assert span.days > 600
+
+
+def test_parse_source_mix() -> None:
+    assert parse_source_mix("none=0.8,paper-forms=0.2") == {None: 0.8, "paper-forms": 0.2}
+
+
+@pytest.mark.asyncio
+async def test_seeded_rows_load_into_database(
+    db_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    batch = next(generate_batches(SeedProfile(rows=500), batch_size=500))
+    async with db_session_factory() as session:
+        await insert_feedback_rows(session, to_rows(batch))
+        await session.commit()
+        total = (await session.execute(select(func.count(FeedBack.id)))).scalar_one()
+    assert total == 500
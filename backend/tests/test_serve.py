@@ -0,0 +1,28 @@
+import pytest
+
+import serve
+from core.config import Settings
+
+
+def test_idempotency_table_defaults_on_for_multiple_workers() -> None:
+    assert Settings(WEB_CONCURRENCY=1).idempotency_db_enabled() is False
+    assert Settings(WEB_CONCURRENCY=4).idempotency_db_enabled() is True
+    assert Settings(WEB_CONCURRENCY=0).idempotency_db_enabled() is True
+    assert Settings(WEB_CONCURRENCY=1, IDEMPOTENCY_DB_ENABLED=True).idempotency_db_enabled() is True
+
+
+def test_refuses_multiple_workers_without_shared_idempotency(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(serve, "get_settings", lambda: Settings(WEB_CONCURRENCY=3, IDEMPOTENCY_DB_ENABLED=False))
+    monkeypatch.setattr(serve.uvicorn, "run", lambda *args, **kwargs: pytest.fail("server started"))
+    with pytest.raises(SystemExit, match="3 workers"):
+        serve.main()
+
+
+def test_auto_worker_count_respects_cpu_quota(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(serve, "get_settings", lambda: Settings(WEB_CONCURRENCY=0))
+    monkeypatch.setattr(serve.os, "sched_getaffinity", lambda pid: set(range(32)))
+    monkeypatch.setattr(serve, "_cgroup_cpu_quota", lambda: 0.1)
+    assert serve.worker_count() == 1
+
+    monkeypatch.setattr(serve, "_cgroup_cpu_quota", lambda: 2.5)
+    assert serve.worker_count() == 2
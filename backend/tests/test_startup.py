@@ -0,0 +1,34 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from core.public_feed import public_feed
+from core.startup import startup_state, warmup
+
+
+@pytest.mark.asyncio
+async def test_readyz_flips_after_warmup(
+    api_client: AsyncClient,
+    fresh_engine: AsyncEngine,
+) -> None:
+    startup_state.ready = False
+    try:
+        response = await api_client.get("/readyz")
+        assert response.status_code == 503
+        assert response.json()["ready"] is False
+
+        await warmup(
+            fresh_engine,
+            async_sessionmaker(bind=fresh_engine, class_=AsyncSession, expire_on_commit=False),
+            pool_connections=2,
+            budget_seconds=10,
+        )
+
+        response = await api_client.get("/readyz")
+        assert response.status_code == 200
+        payload = response.json()
+        assert payload["ready"] is True
+        assert {"warmup_pool", "warmup_public_feed", "warmup_security", "warmup_total"} <= payload["startup_ms"].keys()
+        assert public_feed.snapshot is not None
+    finally:
+        startup_state.ready = False
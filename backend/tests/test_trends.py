@@ -0,0 +1,101 @@
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.trends import count_terms, extract_terms, trend_counter, upsert_term_counts
+from crud.feedback_import import insert_feedback_rows
+from models.term_daily_count import TermDailyCount
+from scripts.backfill_trends import backfill_terms
+from scripts.seed_feedback import SeedProfile, generate_batches, to_rows
+
+
+def test_extract_terms_handles_cyrillic_stopwords_and_bigrams() -> None:
+    terms = extract_terms("Очень долго ждали! Время ожидания — 40 минут, но десерт ВКУСНЫЙ, всё ок.")
+
+    assert {"долго", "ждали", "долго ждали", "время ожидания", "десерт", "десерт вкусный"} <= terms
+    assert "очень" not in terms
+    assert "но" not in terms
+    assert "40" not in terms
+    # The stopword breaks the bigram chain.
+    assert "минут десерт" not in terms
+    assert extract_terms("Всё ещё ёлка") == extract_terms("все еще елка")
+
+
+@pytest.mark.asyncio
+async def test_trends_report_top_and_rising_terms(
+    api_client: AsyncClient,
+    admin_auth_header: dict[str, str],
+    db_session_factory: async_sessionmaker[AsyncSession],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(trend_counter, "session_factory", db_session_factory)
+    today = datetime.now(timezone.utc).date()
+    async with db_session_factory() as session:
+        # "плов" was popular last month, "десерт" was barely mentioned.
+        await upsert_term_counts(session, Counter({
+            (today - timedelta(days=10), "плов"): 20,
+            (today - timedelta(days=12), "десерт"): 1,
+        }))
+        await session.commit()
+
+    for text in ("Десерт отличный", "Десерт холодный", "Плов и десерт", "Плов остыл"):
+        response = await api_client.post("/api/v1/feedback/create", json={
+            "type": "review",
+            "rating": 8,
+            "text": text,
+            "name": "Trend Guest",
+            "contact": "@trend",
+        })
+        assert response.status_code == 201
+
+    assert trend_counter.pending > 0
+    await trend_counter.flush()
+    assert trend_counter.pending == 0
+
+    response = await api_client.get(
+        "/api/v1/feedback/admin/trends?days=7&baseline_days=28&min_count=2",
+        headers=admin_auth_header,
+    )
+    assert response.status_code == 200
+    report = response.json()
+    assert report["period_end"] == today.isoformat()
+    assert [(t["term"], t["count"], t["baseline_count"]) for t in report["top"]] == [
+        ("десерт", 3, 1),
+        ("плов", 2, 20),
+    ]
+    assert [t["term"] for t in report["rising"]] == ["десерт"]
+    assert report["rising"][0]["change"] == pytest.approx((4 / 7) / (2 / 28), abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_trends_requires_auth(api_client: AsyncClient) -> None:
+    response = await api_client.get("/api/v1/feedback/admin/trends")
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_backfill_matches_live_counting_and_replaces_days(
+    db_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    profile = SeedProfile(rows=1500, years=0.1)
+    rows = [row for batch in generate_batches(profile, batch_size=500) for row in to_rows(batch)]
+    until = datetime.now(timezone.utc).date() + timedelta(days=1)
+
+    async with db_session_factory() as session:
+        await insert_feedback_rows(session, rows)
+        # A stale counter that the backfill must overwrite.
+        await upsert_term_counts(session, Counter({(date(2000, 1, 1), "stale"): 5}))
+        await session.commit()
+
+        stats = await backfill_terms(session, since=None, until=until, batch_size=400)
+        res = await session.execute(select(TermDailyCount.day, TermDailyCount.term, TermDailyCount.count))
+        stored = {(day, term): count for day, term, count in res.all()}
+
+    expected = count_terms((row["text"], row["created_at"]) for row in rows)
+    assert stats.feedbacks == 1500
+    assert stats.counters == len(expected)
+    assert stored == dict(expected)
@@ -32,12 +32,12 @@ const toTimestamp = (value: string) => {
 
 export default function Analytics() {
   const apiBase = import.meta.env.VITE_API_BASE_URL ?? "";
-  const { token, email, password, authStatus, authError, setEmail, setPassword, handleLogin, logout } =
+  const { token, email, password, authStatus, authError, setEmail, setPassword, handleLogin, logout, refreshSession } =
     useAdminAuth(apiBase);
   const { items, status, error, stats } = useAdminFeedback({
     apiBase,
     token,
-    onUnauthorized: logout,
+    onUnauthorized: refreshSession,
   });
 
   const [range, setRange] = useState<RangeFilter>(30);
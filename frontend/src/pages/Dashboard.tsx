@@ -9,12 +9,12 @@ type FeedbackType = "review" | "suggestion";
 
 export default function Dashboard() {
   const apiBase = import.meta.env.VITE_API_BASE_URL ?? "";
-  const { token, email, password, authStatus, authError, setEmail, setPassword, handleLogin, logout } =
+  const { token, email, password, authStatus, authError, setEmail, setPassword, handleLogin, logout, refreshSession } =
     useAdminAuth(apiBase);
   const { items, status, error, actionError, approveFeedback, deleteFeedback, stats, formatDate } = useAdminFeedback({
     apiBase,
     token,
-    onUnauthorized: logout,
+    onUnauthorized: refreshSession,
   });
 
   const [filter, setFilter] = useState<"all" | FeedbackType>("all");
@@ -10,12 +10,12 @@ type StatusFilter = "all" | "approved" | "pending";
 
 export default function Reviews() {
   const apiBase = import.meta.env.VITE_API_BASE_URL ?? "";
-  const { token, email, password, authStatus, authError, setEmail, setPassword, handleLogin, logout } =
+  const { token, email, password, authStatus, authError, setEmail, setPassword, handleLogin, logout, refreshSession } =
     useAdminAuth(apiBase);
   const { items, status, error, actionError, approveFeedback, deleteFeedback, formatDate } = useAdminFeedback({
     apiBase,
     token,
-    onUnauthorized: logout,
+    onUnauthorized: refreshSession,
   });
 
   const [filter, setFilter] = useState<"all" | FeedbackType>("all");
@@ -16,7 +16,7 @@ const DEFAULT_SETTINGS: ModerationSettings = {
 
 export default function Settings() {
   const apiBase = import.meta.env.VITE_API_BASE_URL ?? "";
-  const { token, email, password, authStatus, authError, setEmail, setPassword, handleLogin, logout } =
+  const { token, email, password, authStatus, authError, setEmail, setPassword, handleLogin, logout, refreshSession } =
     useAdminAuth(apiBase);
 
   const [settings, setSettings] = useState<ModerationSettings>(DEFAULT_SETTINGS);
@@ -38,12 +38,12 @@ export default function Settings() {
         headers,
       });
       if (response.status === 401) {
-        logout();
+        void refreshSession();
         throw new Error("Требуется вход");
       }
       return response;
     },
-    [apiBase, logout, token]
+    [apiBase, refreshSession, token]
   );
 
   const loadSettings = useCallback(async () => {
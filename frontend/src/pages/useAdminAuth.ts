@@ -1,6 +1,17 @@
 import { useCallback, useState, type FormEvent } from "react";
 
 const TOKEN_KEY = "admin_token";
+const REFRESH_TOKEN_KEY = "admin_refresh_token";
+
+type TokenResponse = { access_token: string; refresh_token?: string | null };
+
+// Refresh tokens are single-use: the server revokes the whole token family when
+// one is presented twice. The poll, a visibilitychange refetch and parallel 401s
+// in this tab share one in-flight refresh, and tabs take turns through a Web Lock.
+let refreshInFlight: Promise<void> | null = null;
+
+const withRefreshLock = (task: () => Promise<void>): Promise<void> =>
+  "locks" in navigator ? navigator.locks.request("admin-token-refresh", task) : task();
 
 export type AuthState = {
   token: string;
@@ -26,9 +37,67 @@ export default function useAdminAuth(apiBase: string) {
     }
   }, []);
 
+  const saveRefreshToken = useCallback((value: string) => {
+    if (value) {
+      localStorage.setItem(REFRESH_TOKEN_KEY, value);
+    } else {
+      localStorage.removeItem(REFRESH_TOKEN_KEY);
+    }
+  }, []);
+
   const logout = useCallback(() => {
+    const refreshToken = localStorage.getItem(REFRESH_TOKEN_KEY);
+    if (refreshToken) {
+      void fetch(`${apiBase}/api/v1/admin/logout`, {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ refresh_token: refreshToken }),
+      }).catch(() => undefined);
+    }
+    saveRefreshToken("");
     saveToken("");
-  }, [saveToken]);
+  }, [apiBase, saveRefreshToken, saveToken]);
+
+  // Called on 401: swap the refresh token for a new access token instead of
+  // sending the admin back to the login form.
+  const refreshSession = useCallback((): Promise<void> => {
+    if (refreshInFlight) {
+      return refreshInFlight;
+    }
+    const rejectedToken = token;
+    refreshInFlight = withRefreshLock(async () => {
+      const storedToken = localStorage.getItem(TOKEN_KEY) ?? "";
+      if (storedToken && storedToken !== rejectedToken) {
+        // Another tab rotated the pair while we waited; its tokens are already stored.
+        saveToken(storedToken);
+        return;
+      }
+      const refreshToken = localStorage.getItem(REFRESH_TOKEN_KEY);
+      if (!refreshToken) {
+        saveToken("");
+        return;
+      }
+      try {
+        const response = await fetch(`${apiBase}/api/v1/admin/refresh`, {
+          method: "POST",
+          headers: { "Content-Type": "application/json" },
+          body: JSON.stringify({ refresh_token: refreshToken }),
+        });
+        if (!response.ok) {
+          throw new Error("refresh failed");
+        }
+        const data = (await response.json()) as TokenResponse;
+        saveRefreshToken(data.refresh_token ?? "");
+        saveToken(data.access_token);
+      } catch {
+        saveRefreshToken("");
+        saveToken("");
+      }
+    }).finally(() => {
+      refreshInFlight = null;
+    });
+    return refreshInFlight;
+  }, [apiBase, saveRefreshToken, saveToken, token]);
 
   const handleLogin = useCallback(
     async (event: FormEvent<HTMLFormElement>) => {
@@ -50,7 +119,8 @@ export default function useAdminAuth(apiBase: string) {
         if (!response.ok) {
           throw new Error("Неверный логин или пароль");
         }
-        const data = (await response.json()) as { access_token: string };
+        const data = (await response.json()) as TokenResponse;
+        saveRefreshToken(data.refresh_token ?? "");
         saveToken(data.access_token);
         setAuthStatus("idle");
         setPassword("");
@@ -59,7 +129,7 @@ export default function useAdminAuth(apiBase: string) {
         setAuthError(err instanceof Error ? err.message : "Не удалось войти");
       }
     },
-    [apiBase, email, password, saveToken]
+    [apiBase, email, password, saveRefreshToken, saveToken]
   );
 
   return {
@@ -72,6 +142,7 @@ export default function useAdminAuth(apiBase: string) {
     setPassword,
     handleLogin,
     logout,
+    refreshSession,
     saveToken,
   };
 }